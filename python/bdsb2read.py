@@ -84,21 +84,20 @@ def slot2satname(slot):
         return f'R{slot-137:02d}'
     raise Exception(f"mask position should be 1-174 (actual {slot}).")
 
+_SIGNAMES = {  # signal names of satellite system indexed by signal mask
+    'C': ("B1I", "B1C(D)", "B1C(P)", "Reserved", "B2a(D)", "B2a(P)", "Reserved", "B2b-I", "B2b-Q", "Reserved", "Reserved", "Reserved", "B3 I", "Reserved", "Reserved", "Reserved"),
+    'G': ("L1 C/A", "L1 P", "Reserved", "Reserved", "L1C(P)", "L1C(D+P)", "Reserved", "L2C(L)", "L2C(M+L)", "Reserved", "Reserved", "L5 I", "L5 Q", "L5 I+Q", "Reserved", "Reserved"),
+    'R': ("G1 C/A", "G1 P", "G2 C/A", "Reserved", "Reserved", "Reserved", "Reserved", "Reserved", "Reserved", "Reserved", "Reserved", "Reserved", "Reserved", "Reserved", "Reserved", "Reserved"),
+    'E': ("Reserved", "E1 B", "E1 C", "Reserved", "E5a Q", "E5a I", "Reserved", "E5b I", "E5b Q", "Reserved", "Reserved", "E6 C", "Reserved", "Reserved", "Reserved", "Reserved"),
+}
+
 def sigmask2signame(satsys, sigmask):
     ''' convert satellite system and signal mask to signal name '''
-    signame = f'satsys={satsys} sigmask={sigmask}'
-    if   satsys == 'C':
-        signame = ["B1I", "B1C(D)", "B1C(P)", "Reserved", "B2a(D)", "B2a(P)", "Reserved", "B2b-I", "B2b-Q", "Reserved", "Reserved", "Reserved", "B3 I", "Reserved", "Reserved", "Reserved"][sigmask]
-    elif satsys == 'G':
-        signame = ["L1 C/A", "L1 P", "Reserved", "Reserved", "L1C(P)", "L1C(D+P)", "Reserved", "L2C(L)", "L2C(M+L)", "Reserved", "Reserved", "L5 I", "L5 Q", "L5 I+Q", "Reserved", "Reserved"][sigmask]
-    elif satsys == 'R':
-        signame = ["G1 C/A", "G1 P", "G2 C/A", "Reserved", "Reserved", "Reserved", "Reserved", "Reserved", "Reserved", "Reserved", "Reserved", "Reserved", "Reserved", "Reserved", "Reserved", "Reserved"][sigmask]
-    elif satsys == 'E':
-        signame = ["Reserved", "E1 B", "E1 C", "Reserved", "E5a Q", "E5a I", "Reserved", "E5b I", "E5b Q", "Reserved", "Reserved", "E6 C", "Reserved", "Reserved", "Reserved", "Reserved"][sigmask]
-    else:
+    signames = _SIGNAMES.get(satsys)
+    if signames is None:
         raise Exception(
             f'unassigned signal name for satsys={satsys} and sigmask={sigmask}')
-    return signame
+    return signames[sigmask]
 
 class BdsB2():
     epoch  =  0  # epoch in second within one BDT day
@@ -528,6 +527,9 @@ if __name__ == '__main__':
     parser.add_argument(
         '-c', '--color', action='store_true',
         help='apply ANSI color escape sequences even for non-terminal.')
+    parser.add_argument(
+        '-j', '--jit', action='store_true',
+        help='decode SSR messages with numba JIT compiled kernels, faster on long input.')
     parser.add_argument(
         '-m', '--message', action='store_true',
         help='show display messages to stderr')
@@ -550,6 +552,7 @@ if __name__ == '__main__':
     if args.prn < 0:
         libtrace.err(f'PRN should be positive ({args.trace}).')
         sys.exit(1)
+    libssr.JIT |= args.jit
     trace = libtrace.Trace(fp_disp, args.trace, args.color)
     bdsb2 = BdsB2(trace, args.statistics)
     try:
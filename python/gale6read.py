@@ -446,6 +446,9 @@ if __name__ == '__main__':
     parser.add_argument(
         '-c', '--color', action='store_true',
         help='apply ANSI color escape sequences even for non-terminal.')
+    parser.add_argument(
+        '-j', '--jit', action='store_true',
+        help='decode SSR messages with numba JIT compiled kernels, faster on long input.')
     parser.add_argument(
         '-m', '--message', action='store_true',
         help='show display messages to stderr')
@@ -462,6 +465,7 @@ if __name__ == '__main__':
         sys.exit(1)
     if args.message:  # show HAS message to stderr
         fp_disp = sys.stderr
+    libssr.JIT |= args.jit
     trace = libtrace.Trace(fp_disp, args.trace, args.color)
     gale6 = GalE6(trace, args.statistics)
     try:
@@ -16,9 +16,25 @@
 #     Interface Specification Satellite Positioning, Navigation and Timing
 #     Service, IS-QZSS-PNT-005, Oct. 2022.
 
+import re
+import sys
+from   collections import OrderedDict
+
+import libtrace
+
+try:
+    import numpy as np
+except ModuleNotFoundError:
+    libtrace.err('''\
+    This code needs numpy module.
+    Please install this module such as \"pip install numpy\".
+    ''')
+    sys.exit(1)
+
 # format definitions
 FMT_IODC = '<4d'  # format string for issue of data clock
 FMT_IODE = '<4d'  # format string for issue of data ephemeris
+N_EPHHDR = 256    # maximum number of cached ephemeris headers
 
 # constants
 PI = 3.1415926535898            # Ratio of a circle's circumference
@@ -26,390 +42,740 @@ MU = 3.986004418  * (10**14)    # Geocentric gravitational constant [m^3/s^2]
 OE = 7.2921151467 * (10**(-5))  # Mean angular velocity of the Earth [rad/s]
 C  = 299792458                  # Speed of light [m/s]
 
+# scale factors of ephemeris data
+_SC_ANG31 = PI * 2.0**-31  # M_0, Omega_0, i_0, omega [semi-circle]
+_SC_ANG43 = PI * 2.0**-43  # IDOT, delta n, Omega dot [semi-circle/s]
+_SC_E     = 2.0**-33       # eccentricity
+_SC_A12   = 2.0**-19       # square root of the semi-major axis
+_SC_CUC   = 2.0**-29       # C_uc, C_us, C_ic, C_is
+_SC_CRC   = 2.0**-5        # C_rc, C_rs
+_SC_AF0   = 2.0**-34       # a_f0
+_SC_AF1   = 2.0**-46       # a_f1
+_SC_AF2   = 2.0**-59       # a_f2
+_SC_BE5   = 2.0**-32       # BGD E1-E5a, E1-E5b
+_SC_AI0   = 2.0**-2        # a_i0
+_SC_AI1   = 2.0**-8        # a_i1
+_SC_A0    = 2.0**-30       # UTC A_0
+_SC_A1    = 2.0**-50       # UTC A_1
+_SC_A0G   = 2.0**-35       # GGTO A_0G
+_SC_A1G   = 2.0**-51       # GGTO A_1G
+_SC_T16   = 16             # GPS t_oc, t_oe
+_SC_AF0G  = 2.0**-31       # GPS a_f0, T_GD
+_SC_AF1G  = 2.0**-43       # GPS a_f1
+_SC_AF2G  = 2.0**-55       # GPS a_f2
+
+def _compile(fmt):
+    ''' returns unpacker function generated from bit format string such as
+        'u6s14p7', which reads the fields from payload and returns them in
+        a tuple of integers
+        u: unsigned integer, s: two's complement integer,
+        m: sign-magnitude integer (sign bit included in width), p: padding
+    '''
+    fields = []
+    for code, width in re.findall(r'([usmp])(\d+)', fmt):
+        fields.append((code, int(width)))
+    nskip = 0  # trailing reserved bits are skipped without being extracted
+    while fields and fields[-1][0] == 'p':
+        nskip += fields.pop()[1]
+    nbit  = sum(width for _, width in fields)
+    shift = nbit
+    items = []
+    for code, width in fields:
+        shift -= width
+        if code == 'p':  # reserved bits inside the record are never shifted out
+            continue
+        item = f'v >> {shift} & {(1 << width) - 1}'
+        if code == 's':  # two's complement by flipping and subtracting sign bit
+            sign = 1 << (width - 1)
+            item = f'(({item}) ^ {sign}) - {sign}'
+        elif code == 'm':  # magnitude times +1 or -1 from sign bit
+            item = f'(v >> {shift} & {(1 << (width - 1)) - 1}) * (1 - 2 * (v >> {shift + width - 1} & 1))'
+        items.append(item)
+    src = (
+        f'def unpack(payload):\n'
+        f'    pos = payload.pos\n'
+        f'    end = pos + {nbit}\n'
+        f'    if len(payload) < end + {nskip}:\n'
+        f'        raise Exception(f"short ephemeris payload: {{len(payload)}} < {{end + {nskip}}} bits")\n'
+        f'    buf = payload.tobytes()\n'
+        f'    v = int.from_bytes(buf[pos >> 3:(end + 7) >> 3], "big") >> (-end & 7)\n'
+        f'    payload.pos = end + {nskip}\n'
+        f'    return ({", ".join(items)},)\n'
+    )
+    namespace = {}
+    exec(src, namespace)
+    return namespace['unpack']
+
+class _BytesPayload:
+    ''' payload over message bytes for the unpackers, a stand-in for
+        ConstBitStream that hands out its buffer without copying
+    '''
+    __slots__ = ('buf', 'pos')
+
+    def __init__(self, buf, pos=0):
+        self.buf = buf  # message bytes
+        self.pos = pos  # bit position
+
+    def __len__(self):
+        return len(self.buf) * 8
+
+    def tobytes(self):
+        return self.buf
+
+_unpack_gps = _compile(  # GPS ephemerides, ref.[1]
+    'u6'   # satellite id, DF009
+    'u10'  # week number, DF076
+    'u4'   # SV accuracy DF077
+    'u2'   # GPS code L2, DF078
+    's14'  # IDOT, DF079
+    'u8'   # IODE, DF071
+    'u16'  # t_oc, DF081
+    's8'   # a_f2, DF082
+    's16'  # a_f1, DF083
+    's22'  # a_f0, DF084
+    'u10'  # IODC, DF085
+    's16'  # C_rs, DF086
+    's16'  # d_n,  DF087
+    's32'  # M_0,  DF088
+    's16'  # C_uc, DF089
+    'u32'  # e,    DF090
+    's16'  # C_us, DF091
+    'u32'  # a12,  DF092
+    'u16'  # t_oe, DF093
+    's16'  # C_ic, DF094
+    's32'  # Omg0, DF095
+    's16'  # C_is, DF096
+    's32'  # i_0,  DF097
+    's16'  # C_rc, DF098
+    's32'  # omg,  DF099
+    's24'  # Omg-dot, DF100
+    's8'   # t_GD, DF101
+    'u6'   # SV health, DF102
+    'u1'   # P flag, DF103
+    'u1'   # fit interval, DF137
+)
+_FMT_GLO = (  # GLONASS ephemerides
+    'u6'   # satellite id, DF038
+    'u5'   # freq ch, DF040
+    'u1'   # alm health DF104
+    'u1'   # alm health avail, DF105
+    'u2'   # P1, DF106
+    'u12'  # t_k, DF107
+    'u1'   # B_n word MSB, DF108
+    'u1'   # P2, DF109
+    'u7'   # t_b, DF110
+    'm24'  # x_n dot, DF111
+    'm27'  # x_n, DF112
+    'm5'   # x_n dot^2, DF113
+    'm24'  # y_n dot, DF114
+    'm27'  # y_n, DF115
+    'm5'   # y_n dot^2, DF116
+    'm24'  # z_n dot, DF117
+    'm27'  # z_n, DF118
+    'm5'   # z_n dot^2, DF119
+    'u1'   # P3, DF120
+    'm11'  # gamma_n, DF121
+    'u2'   # P, DF122
+    'u1'   # I_n, DF123
+    'm22'  # tau_n, DF124
+    'm5'   # d_tau_n, DF125
+    'u5'   # E_n, DF126
+    'u1'   # P4, DF127
+    'u4'   # F_t, DF128
+    'u11'  # N_t, DF129
+    'u2'   # M, DF130
+    'u1'   # addition, DF131
+    'u11'  # N^A, DF132
+    'm32'  # tau_c, DF133
+    'u5'   # N_4, DF134
+    'm22'  # tau_GPS, DF135
+    'u1'   # I_n, DF136
+    'p7'   # reserved
+)
+_unpack_glo = _compile(_FMT_GLO)
+_FMT_GAL = (  # Galileo ephemerides, common part
+    'u6'   # satellite id, DF252
+    'u12'  # week number, DF289
+    'u10'  # IODnav, DF290
+    'u8'   # SIS Accuracy, DF291
+    's14'  # IDOT, DF292
+    'u14'  # t_oc, DF293
+    's6'   # a_f2, DF294
+    's21'  # a_f1, DF295
+    's31'  # a_f0, DF296
+    's16'  # C_rs, DF297
+    's16'  # delta n, DF298
+    's32'  # M_0, DF299
+    's16'  # C_uc, DF300
+    'u32'  # e, DF301
+    's16'  # C_us, DF302
+    'u32'  # sqrt_a, DF303
+    'u14'  # t_oe, DF304
+    's16'  # C_ic, DF305
+    's32'  # Omega_0, DF306
+    's16'  # C_is, DF307
+    's32'  # i_0, DF308
+    's16'  # C_rc, DF309
+    's32'  # omega, DF310
+    's24'  # Omega-dot0, DF311
+    's10'  # BGD_E5aE1, DF312
+)
+_unpack_gal_fnav = _compile(_FMT_GAL +
+    'u2'   # open signal health DF314
+    'u1'   # open signal valid DF315
+    'p7'   # reserved, DF001
+)
+_unpack_gal_inav = _compile(_FMT_GAL +
+    's10'  # BGD_E5bE1 DF313
+    'u2'   # E5b signal health, DF316
+    'u1'   # E5b data validity, DF317
+    'u2'   # E1b signal health, DF287
+    'u1'   # E1b data validity, DF288
+    'p2'   # reserved, DF001
+)
+_unpack_qzs = _compile(  # QZSS ephemerides
+    'u4'   # satellite id, DF429
+    'u16'  # t_oc, DF430
+    's8'   # a_f2, DF431
+    's16'  # a_f1, DF432
+    's22'  # a_f0, DF433
+    'u8'   # IODE, DF434
+    's16'  # C_rs, DF435
+    's16'  # delta n_0, DF436
+    's32'  # M_0, DF437
+    's16'  # C_uc, DF438
+    'u32'  # e, DF439
+    's16'  # C_uc, DF440
+    'u32'  # sqrt_A, DF441
+    'u16'  # t_oe, DF442
+    's16'  # C_ic, DF443
+    's32'  # Omg_0, DF444
+    's16'  # C_is, DF445
+    's32'  # i_0, DF446
+    's16'  # C_rc, DF447
+    's32'  # omg_n, DF448
+    's24'  # Omg dot, DF449
+    's14'  # i0 dot, DF450
+    'u2'   # L2 code, DF451
+    'u10'  # week number, DF452
+    'u4'   # URA, DF453
+    'u6'   # SVH, DF454
+    's8'   # T_GD, DF455
+    'u10'  # IODC, DF456
+    'u1'   # fit interval, DF457
+)
+_unpack_bds = _compile(  # BeiDou ephemerides
+    'u6'   # satellite id, DF488
+    'u13'  # week number, DF489
+    'u4'   # URA, DF490
+    's14'  # IDOT, DF491
+    'u5'   # AODE, DF492
+    'u17'  # t_oc, DF493
+    's11'  # a_2, DF494
+    's22'  # a_1, DF495
+    's24'  # a_0, DF496
+    'u5'   # AODC, DF497
+    's18'  # C_rs, DF498
+    's16'  # delta n, DF499
+    's32'  # M_0, DF500
+    's18'  # C_uc, DF501
+    'u32'  # e, DF502
+    's18'  # C_us, DF503
+    'u32'  # sqrt_a, DF504
+    'u17'  # t_oe, DF505
+    'u18'  # C_ic, DF506
+    's32'  # Omg_0, DF507
+    's18'  # C_is, DF508
+    's32'  # i_0, DF509
+    's18'  # C_rc, DF510
+    's32'  # omg, DF511
+    's24'  # Omg dot, DF512
+    's10'  # T_GD1, DF513
+    's10'  # T_GD2, DF514
+    'u1'   # SVH, DF515
+)
+_unpack_irn = _compile(  # NavIC ephemerides
+    'u6'   # satellite id, DF516
+    'u10'  # week number, DF517
+    's22'  # a_f0, DF518
+    's16'  # a_f1, DF519
+    's8'   # a_f2, DF520
+    'u4'   # URA, DF521
+    'u16'  # t_oc, DF522
+    's8'   # t_GD, DF523
+    's22'  # delta n, DF524
+    'u8'   # IODEC, DF525
+    'p10'  # reserved, DF526
+    'u1'   # L5_flag, DF527
+    'u1'   # S_flag, DF528
+    's15'  # C_uc, DF529
+    's15'  # C_us, DF530
+    's15'  # C_ic, DF531
+    's15'  # C_is, DF532
+    's15'  # C_rc, DF533
+    's15'  # C_rs, DF534
+    's14'  # IDOT, DF535
+    's32'  # M_0, DF536
+    'u16'  # t_oe, DF537
+    'u32'  # e, DF538
+    'u32'  # sqrt_A, DF539
+    's32'  # Omg0, DF540
+    's32'  # omg, DF541
+    's22'  # Omg dot, DF542
+    's32'  # i0, DF543
+    'p2'   # spare, DF544
+    'p2'   # spare, DF545
+)
+
+# QZSS signal health bits of SV health, ref.[2], p.47, 4.1.2.3(4)
+_QZS_HEALTH = (
+    (0x10, 'L1C/A'),
+    (0x08, 'L2C'  ),
+    (0x04, 'L5'   ),
+    (0x02, 'L1C'  ),
+    (0x01, 'L1C/B'),
+)
+
 class EphRaw:
     ''' raw ephemeris data '''
-    svid  = 0  # satellite id, DF009
-    wn    = 0  # week number, DF076
-    sva   = 0  # space vehicle accuracy, DF077
-    gpsc  = 0  # GPS code L2, DF078
-    idot  = 0  # rate of change of inclination angle, DF079
-    iode  = 0  # IODE, DF079
-    toc   = 0  # t_oc, DF081
-    af2   = 0  # SV clock drift rate correction coefficient, DF082
-    af1   = 0  # SV clock drift correction coefficient, DF083
-    af0   = 0  # SV clock bias correction coefficient, DF084
-    iodc  = 0  # IODC, DF805
-    crs   = 0  # sin harmonic correction term to the orbit radius, DF086
-    dn    = 0  # mean motion difference from computed value, DF087
-    m0    = 0  # mean anomaly at reference time, DF088
-    cuc   = 0  # cos harmonic correction term to the argument of latitude, DF089
-    e     = 0  # eccentricity, DF090
-    cus   = 0  # sin harmonic correction term to the argument of latitude, DF091
-    a12   = 0  # square root of the semi-major axis, DF092
-    toe   = 0  # t_oe, DF093
-    cic   = 0  # cos harmonic correction term to the angle of inclination, DF094
-    omg0  = 0  # longitude of ascending node of orbital plane, DF095
-    cis   = 0  # sin harmonic correction term to the angle of inclination, DF096
-    i0    = 0  # inclination angle at reference time, DF097
-    crc   = 0  # cos harmonic correction term to the orbit radius, DF098
-    omg   = 0  # argument of perigee, DF099
-    omgd  = 0  # rate of change of right ascension, DF100
-    tgd   = 0  # t_GD, DF101
-    svh   = 0  # SV health, DF102
-    l2p   = 0  # P flag, DF103
-    fi    = 0  # fit interval, DF137
+    __slots__ = (
+        'svid' ,  # satellite id, DF009
+        'wn'   ,  # week number, DF076
+        'sva'  ,  # space vehicle accuracy, DF077
+        'gpsc' ,  # GPS code L2, DF078
+        'idot' ,  # rate of change of inclination angle, DF079
+        'iode' ,  # IODE, DF079
+        'toc'  ,  # t_oc, DF081
+        'af2'  ,  # SV clock drift rate correction coefficient, DF082
+        'af1'  ,  # SV clock drift correction coefficient, DF083
+        'af0'  ,  # SV clock bias correction coefficient, DF084
+        'iodc' ,  # IODC, DF805
+        'crs'  ,  # sin harmonic correction term to the orbit radius, DF086
+        'dn'   ,  # mean motion difference from computed value, DF087
+        'm0'   ,  # mean anomaly at reference time, DF088
+        'cuc'  ,  # cos harmonic correction term to the argument of latitude, DF089
+        'e'    ,  # eccentricity, DF090
+        'cus'  ,  # sin harmonic correction term to the argument of latitude, DF091
+        'a12'  ,  # square root of the semi-major axis, DF092
+        'toe'  ,  # t_oe, DF093
+        'cic'  ,  # cos harmonic correction term to the angle of inclination, DF094
+        'omg0' ,  # longitude of ascending node of orbital plane, DF095
+        'cis'  ,  # sin harmonic correction term to the angle of inclination, DF096
+        'i0'   ,  # inclination angle at reference time, DF097
+        'crc'  ,  # cos harmonic correction term to the orbit radius, DF098
+        'omg'  ,  # argument of perigee, DF099
+        'omgd' ,  # rate of change of right ascension, DF100
+        'tgd'  ,  # t_GD, DF101
+        'svh'  ,  # SV health, DF102
+        'l2p'  ,  # P flag, DF103
+        'fi'   ,  # fit interval, DF137
 # GLO
-    fcn   = 0  # freq ch, DF040
-    iodn  = 0  # IODnav, DF209
-    sisa  = 0  # SIS Accuracy, DF291
-    t0e   = 0  # ephemeris reference time
-    t0c   = 0  # clock correction data reference TOW
-    be5a  = 0  # E1-E5a broadcast group delay
-    be5b  = 0  # E1-E5b broadcast group delay
-    ai0   = 0  # effective ionisation level 1st order parameter
-    ai1   = 0  # effective ionisation level 2nd order parameter
-    a0    = 0  # constant term of polynomial
-    a1    = 0  # 1st order term of polynomial
-    dtls  = 0  # leap Second count before leap second adjustment
-    t0t   = 0  # UTC data reference TOW
-    wn0t  = 0  # UTC data reference week number
-    wnlsf = 0  # week number of leap second adjustment
-    dn    = 0  # day number at the end of which a leap second adjustment becomes effective
-    dtlsf = 0  # leap second count after leap second adjustment
-    a0g   = 0  # constant term of the polynomial describing the offset
-    a1g   = 0  # rate of change of the offset
-    t0g   = 0  # reference time for GGTO data
-    wn0g  = 0  # week number of GGTO reference
+        'fcn'  ,  # freq ch, DF040
+        'aha'  , 'p1'  , 'tk'  , 'bn'  , 'p2'  , 'tb'  ,
+        'xnd'  , 'xn'  , 'xndd', 'ynd' , 'yn'  , 'yndd', 'znd' , 'zn'  , 'zndd',
+        'p3'   , 'gmn' , 'p'   , 'in3' , 'taun', 'dtaun', 'en' , 'p4'  , 'ft'  ,
+        'nt'   , 'm'   , 'add' , 'na'  , 'tauc', 'n4'  , 'tgps', 'in5' ,
+# GAL
+        'iodn' ,  # IODnav, DF209
+        'sisa' ,  # SIS Accuracy, DF291
+        'osh'  , 'osv' , 'e5h' , 'e5v' , 'e1h' , 'e1v' ,
+# QZS, BDS, IRN
+        'l2'   , 'aode', 'ura' , 'urai', 'a2'  , 'aodc', 'tgd1', 'tgd2',
+        'iodec', 'hl5' , 'hs'  , 'dn0' , 'omgn', 'i0d' , 'omgd0',
+# derived
+        't0e'  ,  # ephemeris reference time
+        't0c'  ,  # clock correction data reference TOW
+        'be5a' ,  # E1-E5a broadcast group delay
+        'be5b' ,  # E1-E5b broadcast group delay
+        'ai0'  ,  # effective ionisation level 1st order parameter
+        'ai1'  ,  # effective ionisation level 2nd order parameter
+        'a0'   ,  # constant term of polynomial
+        'a1'   ,  # 1st order term of polynomial
+        'dtls' ,  # leap Second count before leap second adjustment
+        't0t'  ,  # UTC data reference TOW
+        'wn0t' ,  # UTC data reference week number
+        'wnlsf',  # week number of leap second adjustment
+        'dn_day', # day number at the end of which a leap second adjustment becomes effective
+        'dtlsf',  # leap second count after leap second adjustment
+        'a0g'  ,  # constant term of the polynomial describing the offset
+        'a1g'  ,  # rate of change of the offset
+        't0g'  ,  # reference time for GGTO data
+        'wn0g' ,  # week number of GGTO reference
+    )
+
+    def __getattr__(self, name):
+        ''' returns 0 for a field that the decoder has not set '''
+        if name in EphRaw.__slots__:
+            return 0
+        raise AttributeError(f"'EphRaw' object has no attribute '{name}'")
 
 class EphData:
-    ''' ephemeris data '''
-    def __init__(self, satsys, r=EphRaw()):
+    ''' ephemeris data, base of the satellite system specific classes '''
+    __slots__ = ()
+    _fields_int = ()  # field name, EphRaw field name and scale factor
+
+    @classmethod
+    def from_raws(cls, raws):
+        '''
+        returns decoded ephemeris data of many satellites at once,
+        each field holds a numpy array in the order of raws
+        '''
+        data = cls.__new__(cls)
+        n = len(raws)
+        for name, raw, scale in cls._fields_int:
+            arr = np.fromiter((getattr(r, raw) for r in raws), dtype=np.int64, count=n)
+            setattr(data, name, arr * scale)
+        return data
+
+class EphDataGPS(EphData):
+    ''' GPS ephemeris data '''
+    __slots__ = (
+        'svid', 'm0'  , 'e'   , 'a12' , 'toe' , 'omg0', 'i0'  , 'omg' ,
+        'idot', 'dn'  , 'omgd', 'cuc' , 'cus' , 'crc' , 'crs' , 'cic' ,
+        'cis' , 'toc' , 'af0' , 'af1' , 'af2' , 'tgd' ,
+    )
+    _fields_int = (  # field name, EphRaw field name and scale factor, in the order of __init__
+        ('svid'  , 'svid'  , 1        ),
+        ('m0'    , 'm0'    , _SC_ANG31),
+        ('e'     , 'e'     , _SC_E    ),
+        ('a12'   , 'a12'   , _SC_A12  ),
+        ('toe'   , 'toe'   , _SC_T16  ),
+        ('omg0'  , 'omg0'  , _SC_ANG31),
+        ('i0'    , 'i0'    , _SC_ANG31),
+        ('omg'   , 'omg'   , _SC_ANG31),
+        ('idot'  , 'idot'  , _SC_ANG43),
+        ('dn'    , 'dn'    , _SC_ANG43),
+        ('omgd'  , 'omgd'  , _SC_ANG43),
+        ('cuc'   , 'cuc'   , _SC_CUC  ),
+        ('cus'   , 'cus'   , _SC_CUC  ),
+        ('crc'   , 'crc'   , _SC_CRC  ),
+        ('crs'   , 'crs'   , _SC_CRC  ),
+        ('cic'   , 'cic'   , _SC_CUC  ),
+        ('cis'   , 'cis'   , _SC_CUC  ),
+        ('toc'   , 'toc'   , _SC_T16  ),
+        ('af0'   , 'af0'   , _SC_AF0G ),
+        ('af1'   , 'af1'   , _SC_AF1G ),
+        ('af2'   , 'af2'   , _SC_AF2G ),
+        ('tgd'   , 'tgd'   , _SC_AF0G ),
+    )
+
+    def __init__(self, r=EphRaw()):
         '''
-        returns decoded ephemeris data
+        returns decoded GPS ephemeris data, ref.[1]
         '''
-        self.svid  = r.svid.u                # satellite id
-        self.m0    = r.m0.i   * 2**(-31)*PI  # mean anomaly at reference time
-        self.e     = r.e.u    * 2**(-33)     # eccentricity
-        self.a12   = r.a12.u  * 2**(-19)     # square root of the semi-major axis
-        self.t0e   = r.t0e.u  * 60           # ephemeris reference time
-        self.omg0  = r.omg0.i * 2**(-31)*PI  # longitude of ascending node of orbital plane
-        self.i0    = r.i0.i   * 2**(-31)*PI  # inclination angle at reference time
-        self.omg   = r.omg.i  * 2**(-31)*PI  # argument of perigee
-        self.idot  = r.idot.i * 2**(-43)*PI  # rate of change of inclination angle
-        self.dn    = r.dn.i   * 2**(-43)*PI  # mean motion difference from computed value
-        self.omgd  = r.omgd.i * 2**(-43)*PI  # rate of change of right ascension
-        self.cuc   = r.cuc.i  * 2**(-29)     # cos harmonic correction term to the argument of latitude
-        self.cus   = r.cus.i  * 2**(-29)     # sin harmonic correction term to the argument of latitude
-        self.crc   = r.crc.i  * 2**(-5)      # cos harmonic correction term to the orbit radius
-        self.crs   = r.crs.i  * 2**(-5)      # sin harmonic correction term to the orbit radius
-        self.cic   = r.cic.i  * 2**(-29)     # cos harmonic correction term to the angle of inclination
-        self.cis   = r.cis.i  * 2**(-29)     # sin harmonic correction term to the angle of inclination
-        self.t0c   = r.t0c.u  * 60           # clock correction data reference TOW
-        self.af0   = r.af0.i  * 2**(-34)     # SV clock bias correction coefficient
-        self.af1   = r.af1.i  * 2**(-46)     # SV clock drift correction coefficient
-        self.af2   = r.af2.i  * 2**(-59)     # SV clock drift rate correction coefficient
-        self.be5a  = r.be5a.i * 2**(-32)     # E1-E5a broadcast group delay
-        self.be5b  = r.be5b.i * 2**(-32)     # E1-E5b broadcast group delay
-        self.ai0   = r.ai0.u  * 2**(-2)      # effective ionisation level 1st order parameter
-        self.ai1   = r.ai1.i  * 2**(-8)      # effective ionisation level 2nd order parameter
-        self.a0    = r.a0.i   * 2**(-30)     # constant term of polynomial
-        self.a1    = r.a1.i   * 2**(-50)     # 1st order term of polynomial
-        self.dtls  = r.dtls.i                # leap Second count before leap second adjustment
-        self.t0t   = r.t0t.u                 # UTC data reference TOW
-        self.wn0t  = r.wn0t.u                # UTC data reference week number
-        self.wnlsf = r.wnlsf.u               # week number of leap second adjustment
-        self.dn    = r.dn.u                  # day number at the end of which a leap second adjustment becomes effective
-        self.dtlsf = r.dtlsf.i               # leap second count after leap second adjustment
-        self.a0g   = r.a0g.i  * 2**(-35)     # constant term of the polynomial describing the offset
-        self.a1g   = r.a1g.i  * 2**(-51)     # rate of change of the offset
-        self.t0g   = r.t0g.u  * 3600         # reference time for GGTO data
-        self.wn0g  = r.wn0g.u                # week number of GGTO reference
+        self.svid  = r.svid               # satellite id
+        self.m0    = r.m0   * _SC_ANG31   # mean anomaly at reference time
+        self.e     = r.e    * _SC_E       # eccentricity
+        self.a12   = r.a12  * _SC_A12     # square root of the semi-major axis
+        self.toe   = r.toe  * _SC_T16     # ephemeris reference time
+        self.omg0  = r.omg0 * _SC_ANG31   # longitude of ascending node of orbital plane
+        self.i0    = r.i0   * _SC_ANG31   # inclination angle at reference time
+        self.omg   = r.omg  * _SC_ANG31   # argument of perigee
+        self.idot  = r.idot * _SC_ANG43   # rate of change of inclination angle
+        self.dn    = r.dn   * _SC_ANG43   # mean motion difference from computed value
+        self.omgd  = r.omgd * _SC_ANG43   # rate of change of right ascension
+        self.cuc   = r.cuc  * _SC_CUC     # cos harmonic correction term to the argument of latitude
+        self.cus   = r.cus  * _SC_CUC     # sin harmonic correction term to the argument of latitude
+        self.crc   = r.crc  * _SC_CRC     # cos harmonic correction term to the orbit radius
+        self.crs   = r.crs  * _SC_CRC     # sin harmonic correction term to the orbit radius
+        self.cic   = r.cic  * _SC_CUC     # cos harmonic correction term to the angle of inclination
+        self.cis   = r.cis  * _SC_CUC     # sin harmonic correction term to the angle of inclination
+        self.toc   = r.toc  * _SC_T16     # clock data reference time
+        self.af0   = r.af0  * _SC_AF0G    # SV clock bias correction coefficient
+        self.af1   = r.af1  * _SC_AF1G    # SV clock drift correction coefficient
+        self.af2   = r.af2  * _SC_AF2G    # SV clock drift rate correction coefficient
+        self.tgd   = r.tgd  * _SC_AF0G    # group delay differential
+
+class EphDataGAL(EphData):
+    ''' Galileo ephemeris data '''
+    __slots__ = (
+        'svid', 'm0'  , 'e'   , 'a12' , 't0e' , 'omg0', 'i0'  , 'omg' ,
+        'idot', 'dn'  , 'omgd', 'cuc' , 'cus' , 'crc' , 'crs' , 'cic' ,
+        'cis' , 't0c' , 'af0' , 'af1' , 'af2' , 'be5a', 'be5b', 'ai0' ,
+        'ai1' , 'a0'  , 'a1'  , 'dtls', 't0t' , 'wn0t', 'wnlsf', 'dn_day',
+        'dtlsf', 'a0g', 'a1g' , 't0g' , 'wn0g',
+    )
+    _fields_int = (  # field name, EphRaw field name and scale factor, in the order of __init__
+        ('svid'  , 'svid'  , 1        ),
+        ('m0'    , 'm0'    , _SC_ANG31),
+        ('e'     , 'e'     , _SC_E    ),
+        ('a12'   , 'a12'   , _SC_A12  ),
+        ('t0e'   , 'toe'   , 60       ),
+        ('omg0'  , 'omg0'  , _SC_ANG31),
+        ('i0'    , 'i0'    , _SC_ANG31),
+        ('omg'   , 'omg'   , _SC_ANG31),
+        ('idot'  , 'idot'  , _SC_ANG43),
+        ('dn'    , 'dn'    , _SC_ANG43),
+        ('omgd'  , 'omgd0' , _SC_ANG43),
+        ('cuc'   , 'cuc'   , _SC_CUC  ),
+        ('cus'   , 'cus'   , _SC_CUC  ),
+        ('crc'   , 'crc'   , _SC_CRC  ),
+        ('crs'   , 'crs'   , _SC_CRC  ),
+        ('cic'   , 'cic'   , _SC_CUC  ),
+        ('cis'   , 'cis'   , _SC_CUC  ),
+        ('t0c'   , 'toc'   , 60       ),
+        ('af0'   , 'af0'   , _SC_AF0  ),
+        ('af1'   , 'af1'   , _SC_AF1  ),
+        ('af2'   , 'af2'   , _SC_AF2  ),
+        ('be5a'  , 'be5a'  , _SC_BE5  ),
+        ('be5b'  , 'be5b'  , _SC_BE5  ),
+        ('ai0'   , 'ai0'   , _SC_AI0  ),
+        ('ai1'   , 'ai1'   , _SC_AI1  ),
+        ('a0'    , 'a0'    , _SC_A0   ),
+        ('a1'    , 'a1'    , _SC_A1   ),
+        ('dtls'  , 'dtls'  , 1        ),
+        ('t0t'   , 't0t'   , 1        ),
+        ('wn0t'  , 'wn0t'  , 1        ),
+        ('wnlsf' , 'wnlsf' , 1        ),
+        ('dn_day', 'dn_day', 1        ),
+        ('dtlsf' , 'dtlsf' , 1        ),
+        ('a0g'   , 'a0g'   , _SC_A0G  ),
+        ('a1g'   , 'a1g'   , _SC_A1G  ),
+        ('t0g'   , 't0g'   , 3600     ),
+        ('wn0g'  , 'wn0g'  , 1        ),
+    )
+
+    def __init__(self, r=EphRaw()):
+        '''
+        returns decoded Galileo ephemeris data
+        '''
+        self.svid  = r.svid               # satellite id
+        self.m0    = r.m0   * _SC_ANG31   # mean anomaly at reference time
+        self.e     = r.e    * _SC_E       # eccentricity
+        self.a12   = r.a12  * _SC_A12     # square root of the semi-major axis
+        self.t0e   = r.toe  * 60          # ephemeris reference time
+        self.omg0  = r.omg0 * _SC_ANG31   # longitude of ascending node of orbital plane
+        self.i0    = r.i0   * _SC_ANG31   # inclination angle at reference time
+        self.omg   = r.omg  * _SC_ANG31   # argument of perigee
+        self.idot  = r.idot * _SC_ANG43   # rate of change of inclination angle
+        self.dn    = r.dn   * _SC_ANG43   # mean motion difference from computed value
+        self.omgd  = r.omgd0 * _SC_ANG43  # rate of change of right ascension
+        self.cuc   = r.cuc  * _SC_CUC     # cos harmonic correction term to the argument of latitude
+        self.cus   = r.cus  * _SC_CUC     # sin harmonic correction term to the argument of latitude
+        self.crc   = r.crc  * _SC_CRC     # cos harmonic correction term to the orbit radius
+        self.crs   = r.crs  * _SC_CRC     # sin harmonic correction term to the orbit radius
+        self.cic   = r.cic  * _SC_CUC     # cos harmonic correction term to the angle of inclination
+        self.cis   = r.cis  * _SC_CUC     # sin harmonic correction term to the angle of inclination
+        self.t0c   = r.toc  * 60          # clock correction data reference TOW
+        self.af0   = r.af0  * _SC_AF0     # SV clock bias correction coefficient
+        self.af1   = r.af1  * _SC_AF1     # SV clock drift correction coefficient
+        self.af2   = r.af2  * _SC_AF2     # SV clock drift rate correction coefficient
+        self.be5a  = r.be5a * _SC_BE5     # E1-E5a broadcast group delay
+        self.be5b  = r.be5b * _SC_BE5     # E1-E5b broadcast group delay
+        self.ai0   = r.ai0  * _SC_AI0     # effective ionisation level 1st order parameter
+        self.ai1   = r.ai1  * _SC_AI1     # effective ionisation level 2nd order parameter
+        self.a0    = r.a0   * _SC_A0      # constant term of polynomial
+        self.a1    = r.a1   * _SC_A1      # 1st order term of polynomial
+        self.dtls  = r.dtls               # leap Second count before leap second adjustment
+        self.t0t   = r.t0t                # UTC data reference TOW
+        self.wn0t  = r.wn0t               # UTC data reference week number
+        self.wnlsf = r.wnlsf              # week number of leap second adjustment
+        self.dn_day = r.dn_day            # day number at the end of which a leap second adjustment becomes effective
+        self.dtlsf = r.dtlsf              # leap second count after leap second adjustment
+        self.a0g   = r.a0g  * _SC_A0G     # constant term of the polynomial describing the offset
+        self.a1g   = r.a1g  * _SC_A1G     # rate of change of the offset
+        self.t0g   = r.t0g  * 3600        # reference time for GGTO data
+        self.wn0g  = r.wn0g               # week number of GGTO reference
 
 class Eph:
     ''' Ephemeris class '''
     def __init__(self, trace):
         self.trace = trace
+        self._msg_cache = {}  # red colored message strings
+        self._ephhdr_cache = OrderedDict()  # ephemeris headers with IODE and IODC
+
+    def _redmsg(self, s):
+        ''' returns red colored message string, cached by its text '''
+        m = self._msg_cache.get(s)
+        if m is None:
+            m = self._msg_cache[s] = self.trace.msg(0, s, fg='red')
+        return m
+
+    def _ephhdr(self, satsys, r):
+        ''' returns ephemeris header string with IODE and IODC, cached '''
+        key = (satsys, r.svid, r.wn, r.iode, r.iodc)
+        cache = self._ephhdr_cache
+        hdr = cache.get(key)
+        if hdr is None:
+            hdr = cache[key] = f'{satsys}{r.svid:02d} WN={r.wn} IODE={r.iode:{FMT_IODE}} IODC={r.iodc:{FMT_IODC}}'
+            if N_EPHHDR < len(cache):
+                cache.popitem(last=False)
+        return hdr
 
     def decode_ephemerides(self, payload, satsys, mtype):
         ''' returns decoded ephemeris data '''
-        r = EphRaw()
-        msg = ''
-        if satsys == 'G':  # GPS ephemerides
-            r.svid = payload.read( 6).u  # satellite id, DF009
-            r.wn   = payload.read(10).u  # week number, DF076
-            r.sva  = payload.read( 4).u  # SV accuracy DF077
-            r.gpsc = payload.read( 2)    # GPS code L2, DF078
-            r.idot = payload.read(14).i  # IDOT, DF079
-            r.iode = payload.read( 8).u  # IODE, DF071
-            r.toc  = payload.read(16).u  # t_oc, DF081
-            r.af2  = payload.read( 8).i  # a_f2, DF082
-            r.af1  = payload.read(16).i  # a_f1, DF083
-            r.af0  = payload.read(22).i  # a_f0, DF084
-            r.iodc = payload.read(10).u  # IODC, DF085
-            r.crs  = payload.read(16).i  # C_rs, DF086
-            r.dn   = payload.read(16).i  # d_n,  DF087
-            r.m0   = payload.read(32).i  # M_0,  DF088
-            r.cuc  = payload.read(16).i  # C_uc, DF089
-            r.e    = payload.read(32).u  # e,    DF090
-            r.cus  = payload.read(16).i  # C_us, DF091
-            r.a12  = payload.read(32).u  # a12,  DF092
-            r.toe  = payload.read(16).u  # t_oe, DF093
-            r.cic  = payload.read(16).i  # C_ic, DF094
-            r.omg0 = payload.read(32).i  # Omg0, DF095
-            r.cis  = payload.read(16).i  # C_is, DF096
-            r.i0   = payload.read(32).i  # i_0,  DF097
-            r.crc  = payload.read(16).i  # C_rc, DF098
-            r.omg  = payload.read(32).i  # omg,  DF099
-            r.omgd = payload.read(24).i  # Omg-dot, DF100
-            r.tgd  = payload.read( 8).i  # t_GD, DF101
-            r.svh  = payload.read( 6).u  # SV health, DF102
-            r.l2p  = payload.read( 1).u  # P flag, DF103
-            r.fi   = payload.read( 1).u  # fit interval, DF137
-            msg += f'G{r.svid:02d} WN={r.wn} IODE={r.iode:{FMT_IODE}} IODC={r.iodc:{FMT_IODC}}'
-            if   r.gpsc == '0b01': msg += ' L2P'
-            elif r.gpsc == '0b10': msg += ' L2C/A'
-            elif r.gpsc == '0b11': msg += ' L2C'
-            else: msg += f'unknown L2 code: {r.gpsc}'
-            if r.svh:
-                msg += self.trace.msg(0, f' unhealthy({r.svh:02x})', fg='red')
-        elif satsys == 'R':  # GLONASS ephemerides
-            r.svid  = payload.read( 6).u  # satellite id, DF038
-            r.fcn   = payload.read( 5).u  # freq ch, DF040
-            r.svh   = payload.read( 1).u  # alm health DF104
-            r.aha   = payload.read( 1).u  # alm health avail, DF105
-            r.p1    = payload.read( 2).u  # P1, DF106
-            r.tk    = payload.read(12)  # t_k, DF107
-            r.bn    = payload.read( 1).u  # B_n word MSB, DF108
-            r.p2    = payload.read( 1).u  # P2, DF109
-            r.tb    = payload.read( 7).u  # t_b, DF110
-            _sgn    = payload.read( 1).u  # x_n dot, DF111
-            r.xnd   = payload.read(23).u
-            if _sgn: r.xnd = -r.xnd
-            _sgn    = payload.read( 1).u  # x_n, DF112
-            r.xn    = payload.read(26).u
-            if _sgn: r.xn = -r.xn
-            _sgn    = payload.read( 1).u  # x_n dot^2, DF113
-            r.xndd  = payload.read( 4).u
-            if _sgn: r.xndd = -r.xndd
-            _sgn    = payload.read( 1).u  # y_n dot, DF114
-            r.ynd   = payload.read(23).u
-            if _sgn: r.ynd = -r.ynd
-            _sgn    = payload.read( 1).u  # y_n, DF115
-            r.yn    = payload.read(26).u
-            if _sgn: r.yn = -r.yn
-            _sgn    = payload.read( 1).u  # y_n dot^2, DF116
-            r.yndd  = payload.read( 4).u
-            if _sgn: r.yndd = -r.yndd
-            _sgn    = payload.read( 1).u  # z_n dot, DF117
-            r.znd   = payload.read(23).u
-            if _sgn: r.znd = -r.znd
-            _sgn    = payload.read( 1).u  # z_n, DF118
-            r.zn    = payload.read(26).u
-            if _sgn: r.zn = -r.zn
-            _sgn    = payload.read( 1).u  # z_n dot^2, DF119
-            r.zndd  = payload.read( 4).u
-            if _sgn: r.zndd = -r.zndd
-            r.p3    = payload.read( 1).u  # P3, DF120
-            _sgn    = payload.read( 1).u  # gamma_n, DF121
-            r.gmn   = payload.read(10).u
-            if _sgn: r.gmn = -r.gmn
-            r.p     = payload.read( 2)  # P, DF122
-            r.in3   = payload.read( 1).u  # I_n, DF123
-            _sgn    = payload.read( 1).u  # tau_n, DF124
-            r.taun  = payload.read(21).u
-            if _sgn: r.taun = -r.taun
-            _sgn    = payload.read( 1).u  # d_tau_n, DF125
-            r.dtaun = payload.read( 4).u
-            if _sgn: r.dtaun = -r.dtaun
-            r.en    = payload.read( 5).u  # E_n, DF126
-            r.p4    = payload.read( 1).u  # P4, DF127
-            r.ft    = payload.read( 4).u  # F_t, DF128
-            r.nt    = payload.read(11).u  # N_t, DF129
-            r.m     = payload.read( 2)  # M, DF130
-            r.add   = payload.read( 1).u  # addition, DF131
-            r.na    = payload.read(11).u  # N^A, DF132
-            _sgn    = payload.read( 1).u  # tau_c, DF133
-            r.tauc  = payload.read(31).u
-            if _sgn: r.tauc = -r.tauc
-            r.n4    = payload.read( 5).u  # N_4, DF134
-            _sgn    = payload.read( 1).u  # tau_GPS, DF135
-            r.tgps  = payload.read(21).u
-            if _sgn: r.tgps = -r.tgps
-            r.in5   = payload.read( 1).u  # I_n, DF136
-            payload.pos +=  7              # reserved
-            msg += f'R{r.svid:02d} f={r.fcn:02d} tk={r.tk[7:12].u:02d}:{r.tk[1:7].u:02d}:{r.tk[0:2].u*15:02d} tb={r.tb*15}min'
-            if r.svh:
-                msg += self.trace.msg(0, ' unhealthy', fg='red')
-        elif satsys == 'E':  # Galileo ephemerides
-            r.svid  = payload.read( 6).u  # satellite id, DF252
-            r.wn    = payload.read(12).u  # week number, DF289
-            r.iodn  = payload.read(10).u  # IODnav, DF290
-            r.sisa  = payload.read( 8).u  # SIS Accuracy, DF291
-            r.idot  = payload.read(14).i  # IDOT, DF292
-            r.toc   = payload.read(14).u  # t_oc, DF293
-            r.af2   = payload.read( 6).i  # a_f2, DF294
-            r.af1   = payload.read(21).i  # a_f1, DF295
-            r.af0   = payload.read(31).i  # a_f0, DF296
-            r.crs   = payload.read(16).i  # C_rs, DF297
-            r.dn    = payload.read(16).i  # delta n, DF298
-            r.m0    = payload.read(32).i  # M_0, DF299
-            r.cuc   = payload.read(16).i  # C_uc, DF300
-            r.e     = payload.read(32).u  # e, DF301
-            r.cus   = payload.read(16).i  # C_us, DF302
-            r.a12   = payload.read(32).u  # sqrt_a, DF303
-            r.toe   = payload.read(14).u  # t_oe, DF304
-            r.cic   = payload.read(16).i  # C_ic, DF305
-            r.omg0  = payload.read(32).i  # Omega_0, DF306
-            r.cis   = payload.read(16).i  # C_is, DF307
-            r.i0    = payload.read(32).i  # i_0, DF308
-            r.crc   = payload.read(16).i  # C_rc, DF309
-            r.omg   = payload.read(32).i  # omega, DF310
-            r.omgd0 = payload.read(24).i  # Omega-dot0, DF311
-            r.be5a  = payload.read(10).i  # BGD_E5aE1, DF312
-            if   mtype == 'F/NAV':
-                r.osh = payload.read(2).u  # open signal health DF314
-                r.osv = payload.read(1).u  # open signal valid DF315
-                payload.pos += 7            # reserved, DF001
-            elif mtype == 'I/NAV':
-                r.be5b = payload.read(10).i  # BGD_E5bE1 DF313
-                r.e5h  = payload.read( 2).u  # E5b signal health, DF316
-                r.e5v  = payload.read( 1).u  # E5b data validity, DF317
-                r.e1h  = payload.read( 2).u  # E1b signal health, DF287
-                r.e1v  = payload.read( 1).u  # E1b data validity, DF288
-                payload.pos += 2              # reserved, DF001
-            else:
-                raise Exception(f'unknown Galileo nav message: {mtype}')
-            msg += f'E{r.svid:02d} WN={r.wn} IODnav={r.iodn}'
-            if   mtype == 'F/NAV':
-                if r.osh:
-                    msg += self.trace.msg(0, f' unhealthy OS ({r.osh})', fg='red')
-                if r.osv:
-                    msg += self.trace.msg(0, ' invalid OS', fg='red')
-            elif mtype == 'I/NAV':
-                if r.e5h:
-                    msg += self.trace.msg(0, f' unhealthy E5b ({r.e5h})', fg='red')
-                if r.e5v:
-                    msg += self.trace.msg(0, ' invalid E5b', fg='red')
-                if r.e1h:
-                    msg += self.trace.msg(0, f' unhealthy E1b ({r.e1h})', fg='red')
-                if r.e1v:
-                    msg += self.trace.msg(0, ' invalid E1b', fg='red')
-            else:
+        key = f'E_{mtype}' if satsys == 'E' else satsys
+        decoder = self._DECODERS.get(key)
+        if decoder is None:
+            if satsys == 'E':
                 raise Exception(f'unknown Galileo nav message: {mtype}')
-        elif satsys == 'J':  # QZSS ephemerides
-            r.svid = payload.read( 4).u  # satellite id, DF429
-            r.toc  = payload.read(16).u  # t_oc, DF430
-            r.af2  = payload.read( 8).i  # a_f2, DF431
-            r.af1  = payload.read(16).i  # a_f1, DF432
-            r.af0  = payload.read(22).i  # a_f0, DF433
-            r.iode = payload.read( 8).u  # IODE, DF434
-            r.crs  = payload.read(16).i  # C_rs, DF435
-            r.dn0  = payload.read(16).i  # delta n_0, DF436
-            r.m0   = payload.read(32).i  # M_0, DF437
-            r.cuc  = payload.read(16).i  # C_uc, DF438
-            r.e    = payload.read(32).u  # e, DF439
-            r.cus  = payload.read(16).i  # C_uc, DF440
-            r.a12  = payload.read(32).u  # sqrt_A, DF441
-            r.toe  = payload.read(16).u  # t_oe, DF442
-            r.cic  = payload.read(16).i  # C_ic, DF443
-            r.omg0 = payload.read(32).i  # Omg_0, DF444
-            r.cis  = payload.read(16).i  # C_is, DF445
-            r.i0   = payload.read(32).i  # i_0, DF446
-            r.crc  = payload.read(16).i  # C_rc, DF447
-            r.omgn = payload.read(32).i  # omg_n, DF448
-            r.omgd = payload.read(24).i  # Omg dot, DF449
-            r.i0d  = payload.read(14).i  # i0 dot, DF450
-            r.l2   = payload.read( 2).u  # L2 code, DF451
-            r.wn   = payload.read(10).u  # week number, DF452
-            r.ura  = payload.read( 4).u  # URA, DF453
-            r.svh  = payload.read( 6)  # SVH, DF454
-            r.tgd  = payload.read( 8).i  # T_GD, DF455
-            r.iodc = payload.read(10).u  # IODC, DF456
-            r.fi   = payload.read( 1).u  # fit interval, DF457
-            msg += f'J{r.svid:02d} WN={r.wn} IODE={r.iode:{FMT_IODE}} IODC={r.iodc:{FMT_IODC}}'
-            if (r.svh[0:1]+r.svh[2:5]).u:  # determination of QZSS health including L1C/B is complex, ref.[2], p.47, 4.1.2.3(4)
-                unhealthy = ''
-                if r.svh[1]: unhealthy += ' L1C/A'
-                if r.svh[2]: unhealthy += ' L2C'
-                if r.svh[3]: unhealthy += ' L5'
-                if r.svh[4]: unhealthy += ' L1C'
-                if r.svh[5]: unhealthy += ' L1C/B'
-                msg += self.trace.msg(0, f' unhealthy ({unhealthy[1:]})', fg='red')
-            elif not r.svh[0]:                # L1 signal is healthy
-                if r.svh[1]: msg += ' L1C/B'  # transmitting L1C/B
-                if r.svh[5]: msg += ' L1C/A'  # transmitting L1C/A
-        elif satsys == 'C':  # BeiDou ephemerides
-            r.svid = payload.read( 6).u  # satellite id, DF488
-            r.wn   = payload.read(13).u  # week number, DF489
-            r.urai = payload.read( 4).u  # URA, DF490
-            r.idot = payload.read(14).i  # IDOT, DF491
-            r.aode = payload.read( 5).u  # AODE, DF492
-            r.toc  = payload.read(17).u  # t_oc, DF493
-            r.a2   = payload.read(11).i  # a_2, DF494
-            r.a1   = payload.read(22).i  # a_1, DF495
-            r.a0   = payload.read(24).i  # a_0, DF496
-            r.aodc = payload.read( 5).u  # AODC, DF497
-            r.crs  = payload.read(18).i  # C_rs, DF498
-            r.dn   = payload.read(16).i  # delta n, DF499
-            r.m0   = payload.read(32).i  # M_0, DF500
-            r.cuc  = payload.read(18).i  # C_uc, DF501
-            r.e    = payload.read(32).u  # e, DF502
-            r.cus  = payload.read(18).i  # C_us, DF503
-            r.a12  = payload.read(32).u  # sqrt_a, DF504
-            r.toe  = payload.read(17).u  # t_oe, DF505
-            r.cic  = payload.read(18).u  # C_ic, DF506
-            r.omg0 = payload.read(32).i  # Omg_0, DF507
-            r.cis  = payload.read(18).i  # C_is, DF508
-            r.i0   = payload.read(32).i  # i_0, DF509
-            r.crc  = payload.read(18).i  # C_rc, DF510
-            r.omg  = payload.read(32).i  # omg, DF511
-            r.omgd = payload.read(24).i  # Omg dot, DF512
-            r.tgd1 = payload.read(10).i  # T_GD1, DF513
-            r.tgd2 = payload.read(10).i  # T_GD2, DF514
-            r.svh  = payload.read( 1).u  # SVH, DF515
-            msg +=f'C{r.svid:02d} WN={r.wn} AODE={r.aode}'
-            if r.svh:
-                msg += self.trace.msg(0, ' unhealthy', fg='red')
-        elif satsys == 'I':  # NavIC ephemerides
-            r.svid  = payload.read( 6).u  # satellite id, DF516
-            r.wn    = payload.read(10).u  # week number, DF517
-            r.af0   = payload.read(22).i  # a_f0, DF518
-            r.af1   = payload.read(16).i  # a_f1, DF519
-            r.af2   = payload.read( 8).i  # a_f2, DF520
-            r.ura   = payload.read( 4).u  # URA, DF521
-            r.toc   = payload.read(16).u  # t_oc, DF522
-            r.tgd   = payload.read( 8).i  # t_GD, DF523
-            r.dn    = payload.read(22).i  # delta n, DF524
-            r.iodec = payload.read( 8).u  # IODEC, DF525
-            payload.pos += 10              # reserved, DF526
-            r.hl5   = payload.read( 1).u  # L5_flag, DF527
-            r.hs    = payload.read( 1).u  # S_flag, DF528
-            r.cuc   = payload.read(15).i  # C_uc, DF529
-            r.cus   = payload.read(15).i  # C_us, DF530
-            r.cic   = payload.read(15).i  # C_ic, DF531
-            r.cis   = payload.read(15).i  # C_is, DF532
-            r.crc   = payload.read(15).i  # C_rc, DF533
-            r.crs   = payload.read(15).i  # C_rs, DF534
-            r.idot  = payload.read(14).i  # IDOT, DF535
-            r.m0    = payload.read(32).i  # M_0, DF536
-            r.toe   = payload.read(16).u  # t_oe, DF537
-            r.e     = payload.read(32).u  # e, DF538
-            r.a12   = payload.read(32).u  # sqrt_A, DF539
-            r.omg0  = payload.read(32).i  # Omg0, DF540
-            r.omg   = payload.read(32).i  # omg, DF541
-            r.omgd  = payload.read(22).i  # Omg dot, DF542
-            r.i0    = payload.read(32).i  # i0, DF543
-            payload.pos += 2               # spare, DF544
-            payload.pos += 2               # spare, DF545
-            msg += f'I{r.svid:02d} WN={r.wn} IODEC={r.iodec:{FMT_IODE}}'
-            if r.hl5 or r.hs:
-                msg += self.trace.msg(0, f" unhealthy{' L5' if r.hl5 else ''}{' S' if r.hs else ''}", fg='red')
-        else:
             raise Exception(f'unknown satsys({satsys})')
-        return msg
+        return decoder(self, payload)
+
+    def _decode_gps(self, payload):
+        ''' returns decoded GPS ephemeris '''
+        r = EphRaw()
+        (r.svid, r.wn  , r.sva , r.gpsc, r.idot, r.iode, r.toc , r.af2 ,
+         r.af1 , r.af0 , r.iodc, r.crs , r.dn  , r.m0  , r.cuc , r.e   ,
+         r.cus , r.a12 , r.toe , r.cic , r.omg0, r.cis , r.i0  , r.crc ,
+         r.omg , r.omgd, r.tgd , r.svh , r.l2p , r.fi  ,
+        ) = _unpack_gps(payload)
+        parts = [self._ephhdr('G', r)]
+        if   r.gpsc == 1: parts.append(' L2P')
+        elif r.gpsc == 2: parts.append(' L2C/A')
+        elif r.gpsc == 3: parts.append(' L2C')
+        else: parts.append(f'unknown L2 code: {r.gpsc:#04b}')
+        if r.svh:
+            parts.append(self._redmsg(f' unhealthy({r.svh:02x})'))
+        return ''.join(parts)
+
+    def _decode_glo(self, payload):
+        ''' returns decoded GLONASS ephemeris '''
+        r = EphRaw()
+        (r.svid, r.fcn , r.svh , r.aha , r.p1  , r.tk  , r.bn  , r.p2  ,
+         r.tb  , r.xnd , r.xn  , r.xndd, r.ynd , r.yn  , r.yndd, r.znd ,
+         r.zn  , r.zndd, r.p3  , r.gmn , r.p   , r.in3 , r.taun, r.dtaun,
+         r.en  , r.p4  , r.ft  , r.nt  , r.m   , r.add , r.na  , r.tauc,
+         r.n4  , r.tgps, r.in5 ,
+        ) = _unpack_glo(payload)
+        hh = r.tk >> 7          # t_k hours, DF107 bits 11-7
+        mm = r.tk >> 1 & 0x3f   # t_k minutes, DF107 bits 6-1
+        ss = (r.tk & 1) * 30    # t_k 30-second interval, DF107 bit 0
+        parts = [f'R{r.svid:02d} f={r.fcn:02d} tk={hh:02d}:{mm:02d}:{ss:02d} tb={r.tb*15}min']
+        if r.svh:
+            parts.append(self._redmsg(' unhealthy'))
+        return ''.join(parts)
+
+    def _decode_gal_fnav(self, payload):
+        ''' returns decoded Galileo F/NAV ephemeris '''
+        r = EphRaw()
+        (r.svid , r.wn  , r.iodn, r.sisa, r.idot, r.toc , r.af2 , r.af1 ,
+         r.af0  , r.crs , r.dn  , r.m0  , r.cuc , r.e   , r.cus , r.a12 ,
+         r.toe  , r.cic , r.omg0, r.cis , r.i0  , r.crc , r.omg ,
+         r.omgd0, r.be5a, r.osh , r.osv ,
+        ) = _unpack_gal_fnav(payload)
+        parts = [f'E{r.svid:02d} WN={r.wn} IODnav={r.iodn}']
+        if r.osh:
+            parts.append(self._redmsg(f' unhealthy OS ({r.osh})'))
+        if r.osv:
+            parts.append(self._redmsg(' invalid OS'))
+        return ''.join(parts)
+
+    def _decode_gal_inav(self, payload):
+        ''' returns decoded Galileo I/NAV ephemeris '''
+        r = EphRaw()
+        (r.svid , r.wn  , r.iodn, r.sisa, r.idot, r.toc , r.af2 , r.af1 ,
+         r.af0  , r.crs , r.dn  , r.m0  , r.cuc , r.e   , r.cus , r.a12 ,
+         r.toe  , r.cic , r.omg0, r.cis , r.i0  , r.crc , r.omg ,
+         r.omgd0, r.be5a, r.be5b, r.e5h , r.e5v , r.e1h , r.e1v ,
+        ) = _unpack_gal_inav(payload)
+        parts = [f'E{r.svid:02d} WN={r.wn} IODnav={r.iodn}']
+        if r.e5h:
+            parts.append(self._redmsg(f' unhealthy E5b ({r.e5h})'))
+        if r.e5v:
+            parts.append(self._redmsg(' invalid E5b'))
+        if r.e1h:
+            parts.append(self._redmsg(f' unhealthy E1b ({r.e1h})'))
+        if r.e1v:
+            parts.append(self._redmsg(' invalid E1b'))
+        return ''.join(parts)
+
+    def _decode_qzs(self, payload):
+        ''' returns decoded QZSS ephemeris '''
+        r = EphRaw()
+        (r.svid, r.toc , r.af2 , r.af1 , r.af0 , r.iode, r.crs , r.dn0 ,
+         r.m0  , r.cuc , r.e   , r.cus , r.a12 , r.toe , r.cic , r.omg0,
+         r.cis , r.i0  , r.crc , r.omgn, r.omgd, r.i0d , r.l2  , r.wn  ,
+         r.ura , r.svh , r.tgd , r.iodc, r.fi  ,
+        ) = _unpack_qzs(payload)
+        parts = [self._ephhdr('J', r)]
+        if r.svh & 0x2e:  # determination of QZSS health including L1C/B is complex, ref.[2], p.47, 4.1.2.3(4)
+            unhealthy = ' '.join(name for mask, name in _QZS_HEALTH if r.svh & mask)
+            parts.append(self._redmsg(f' unhealthy ({unhealthy})'))
+        elif not r.svh & 0x20:              # L1 signal is healthy
+            if r.svh & 0x10: parts.append(' L1C/B')  # transmitting L1C/B
+            if r.svh & 0x01: parts.append(' L1C/A')  # transmitting L1C/A
+        return ''.join(parts)
+
+    def _decode_bds(self, payload):
+        ''' returns decoded BeiDou ephemeris '''
+        r = EphRaw()
+        (r.svid, r.wn  , r.urai, r.idot, r.aode, r.toc , r.a2  , r.a1  ,
+         r.a0  , r.aodc, r.crs , r.dn  , r.m0  , r.cuc , r.e   , r.cus ,
+         r.a12 , r.toe , r.cic , r.omg0, r.cis , r.i0  , r.crc , r.omg ,
+         r.omgd, r.tgd1, r.tgd2, r.svh ,
+        ) = _unpack_bds(payload)
+        parts = [f'C{r.svid:02d} WN={r.wn} AODE={r.aode}']
+        if r.svh:
+            parts.append(self._redmsg(' unhealthy'))
+        return ''.join(parts)
+
+    def _decode_irn(self, payload):
+        ''' returns decoded NavIC ephemeris '''
+        r = EphRaw()
+        (r.svid , r.wn  , r.af0 , r.af1 , r.af2 , r.ura , r.toc , r.tgd ,
+         r.dn   , r.iodec, r.hl5, r.hs  , r.cuc , r.cus , r.cic , r.cis ,
+         r.crc  , r.crs , r.idot, r.m0  , r.toe , r.e   , r.a12 , r.omg0,
+         r.omg  , r.omgd, r.i0  ,
+        ) = _unpack_irn(payload)
+        parts = [f'I{r.svid:02d} WN={r.wn} IODEC={r.iodec:{FMT_IODE}}']
+        if r.hl5 or r.hs:
+            parts.append(self._redmsg(f" unhealthy{' L5' if r.hl5 else ''}{' S' if r.hs else ''}"))
+        return ''.join(parts)
+
+    _DECODERS = {  # decoder for satellite system, or Galileo nav message type
+        'G'      : _decode_gps,
+        'R'      : _decode_glo,
+        'E_F/NAV': _decode_gal_fnav,
+        'E_I/NAV': _decode_gal_inav,
+        'J'      : _decode_qzs,
+        'C'      : _decode_bds,
+        'I'      : _decode_irn,
+    }
 
 class Alm:
     ''' Almanac class '''
     pass
 
+if __name__ == '__main__':
+    # encodes GLONASS ephemeris fields, half of the sign-magnitude ones
+    # negative, and checks that the unpacker decodes them back
+    values = []
+    v, nbit = 0, 0
+    for k, (code, width) in enumerate(re.findall(r'([usmp])(\d+)', _FMT_GLO)):
+        width = int(width)
+        if code == 'm':
+            mag = (k * 123457 + 1) % (1 << (width - 1))
+            val = -mag if k % 2 else mag
+            raw = (1 << (width - 1) if val < 0 else 0) | mag
+        else:
+            val = raw = k % (1 << width)
+        if code != 'p':
+            values.append(val)
+        v = v << width | raw
+        nbit += width
+    payload = _BytesPayload((v << (-nbit & 7)).to_bytes((nbit + 7) // 8, 'big'))
+    decoded = _unpack_glo(payload)
+    nneg = sum(1 for val in values if val < 0)
+    if decoded != tuple(values) or payload.pos != nbit:
+        libtrace.err(f'GLONASS sign-magnitude decode error: {decoded} != {tuple(values)}')
+        sys.exit(1)
+    print(f'GLONASS ephemeris: {len(values)} fields, {nneg} negative sign-magnitude, decoded correctly')
+
+    # checks that the vectorized ephemeris data matches the scalar one
+    for cls in (EphDataGPS, EphDataGAL):
+        raws = [EphRaw(), EphRaw()]
+        for k, (name, raw, scale) in enumerate(cls._fields_int):
+            setattr(raws[0], raw, k * 1009 + 1)
+            setattr(raws[1], raw, -(k * 7919 + 3))
+        data = cls.from_raws(raws)
+        for i, r in enumerate(raws):
+            scalar = cls(r)
+            for name, raw, scale in cls._fields_int:
+                vec, val = getattr(data, name)[i], getattr(scalar, name)
+                if vec != val:
+                    libtrace.err(f'{cls.__name__}.from_raws error: {name}[{i}] {vec} != {val}')
+                    sys.exit(1)
+        print(f'{cls.__name__}: {len(cls._fields_int)} fields of {len(raws)} ephemerides, from_raws matches scalar')
+
 # EOF
@@ -26,19 +26,30 @@
 #     Galileo High Accuracy Service Signal-in-Space Interface Control
 #     Document (HAS SIS ICD), Issue 1.0 May 2022.
 
+import os
 import sys
 
 import libtrace
 
 try:
     import bitstring
+    import numpy as np
 except ModuleNotFoundError:
     libtrace.err('''\
-    This code needs bitstring module.
-    Please install this module such as \"pip install bitstring\".
+    This code needs bitstring and numpy modules.
+    Please install this module such as \"pip install bitstring numpy\".
     ''')
     sys.exit(1)
 
+_SATID_BW = {'J': 4, 'R': 5}  # satellite ID bit width, 6 for others, ref.[1, 2]
+_IODE_BW  = {'E': 10}         # IODE bit width, 8 for others
+_STEC_BW  = (                 # STEC polynomial coefficient bit widths by correction type
+    (14,),                    # c00
+    (14, 12, 12),             # c00, c01, c10
+    (14, 12, 12, 10),         # c00, c01, c10, c11
+    (14, 12, 12, 10, 8, 8),   # c00, c01, c10, c11, c02, c20
+)
+
 URA_INVALID = 0    # invalid user range accuracy
 CSSR_UI = [        # CSSR update interval in second, ref.[3], Table 4.2.2-6
     1, 2, 5, 10, 15, 30, 60, 120, 240, 300, 600, 900, 1800, 3600, 7200, 10800
@@ -91,6 +102,21 @@ CLASGRID   = [       # CLAS grid, [location, number of grid, ([lat, lon]), ...,
 ["ISLAND (MINAMI-TORISHIMA)", 1, [(24.28, 153.99),],],
 ["ISLAND (OKINOSHIMA)", 1, [(20.44, 136.09),],],
 ]
+# per-satellite trace lines, with the format strings above substituted
+_LINE_SSR_ORBIT = ('\n{}{:02d}   {:' + FMT_ORB + '}  {:' + FMT_ORB + '}  {:' + FMT_ORB + '}       {:' + FMT_ORB + '}      {:' + FMT_ORB + '}      {:' + FMT_ORB + '}').format
+_LINE_SSR_CLOCK = ('\n{}{:02d} {:' + FMT_CLK + '} {:' + FMT_CLK + '}   {:' + FMT_CLK + '}').format
+_LINE_SSR_CB    = ('\n{}{:02d} {:' + FMT_GSIG + '}    {:' + FMT_CB + '}').format
+_LINE_SSR_URA   = ('\n{}{:02d} {:' + FMT_URA + '}').format
+_LINE_SSR_HRC   = ('\n{}{:02}            {:' + FMT_CLK + '}').format
+_LINE_ORBIT     = ('\n{} {} {:' + FMT_IODE + '}   {:' + FMT_ORB + '}  {:' + FMT_ORB + '}  {:' + FMT_ORB + '}').format
+_LINE_CLOCK     = ('\n{} {} {:' + FMT_CLK + '}').format
+_LINE_CB        = ('\n{} {} {:' + FMT_GSIG + '}        {:' + FMT_CB + '}').format
+_LINE_PB        = ('\n{} {} {:' + FMT_GSIG + '}     {:' + FMT_PB + '}       {}').format
+_LINE_URA       = ('\n{} {} {:' + FMT_URA + '}').format
+# per-grid trace lines
+_LINE_GRID_TECU = ('\n{} {} {:5.2f} {:6.2f}         {:' + FMT_TECU + '}').format
+_LINE_GRID_TROP = ('\n{} {:5.2f} {:6.2f}     {:' + FMT_TROP + '}').format
+
 
 def epoch2time(epoch):
     ''' convert epoch to time
@@ -106,88 +132,291 @@ def epoch2timedate(epoch):
     ''' convert epoch to time plus date'''
     return f'{epoch2time(epoch%86400)}+{epoch//86400}'
 
+_GNSSID2SATSYS = ('G', 'R', 'E', 'C', 'J', 'S')  # satellite system of GNSS ID
+_SIGNAMES = {  # signal names of satellite system indexed by signal mask
+    'G': ( "L1 C/A", "L1 P", "L1 Z-tracking", "L1C(D)", "L1C(P)",
+        "L1C(D+P)", "L2 CM", "L2 CL", "L2 CM+CL", "L2 P", "L2 Z-tracking",
+        "L5 I", "L5 Q", "L5 I+Q", "", ""),
+    'R': ( "G1 C/A", "G1 P", "G2 C/A", "G2 P", "G1a(D)", "G1a(P)",
+        "G1a(D+P)", "G2a(D)", "G2a(P)", "G2a(D+P)", "G3 I", "G3 Q",
+        "G3 I+Q", "", "", "", ""),
+    'E': ( "E1 B", "E1 C", "E1 B+C", "E5a I", "E5a Q", "E5a I+Q",
+        "E5b I", "E5b Q", "E5b I+Q", "E5 I", "E5 Q", "E5 I+Q",
+        "E6 B", "E6 C", "E6 B+C", ""),
+    'C': ( "B1 I", "B1 Q", "B1 I+Q", "B3 I", "B3 Q", "B3 I+Q",
+        "B2 I", "B2 Q", "B2 I+Q", "", "", "", "", "", "", "", ""),
+    'J': ( "L1 C/A", "L1 L1C(D)", "L1 L1C(P)", "L1 L1C(D+P)",
+        "L2 L2C(M)", "L2 L2C(L)", "L2 L2C(M+L)", "L5 I", "L5 Q",
+        "L5 I+Q", "", "", "", "", "", ""),
+    'S': (
+        "L1 C/A", "L5 I", "L5 Q", "L5 I+Q", "", "", "", "", "", "",
+        "", "", "", "", "", "", ""),
+}
+
 def gnssid2satsys(gnssid):
     ''' convert gnss id to satellite system '''
-    if   gnssid == 0: satsys = 'G'
-    elif gnssid == 1: satsys = 'R'
-    elif gnssid == 2: satsys = 'E'
-    elif gnssid == 3: satsys = 'C'
-    elif gnssid == 4: satsys = 'J'
-    elif gnssid == 5: satsys = 'S'
-    else: raise Exception(f'undefined gnssid {gnssid}')
-    return satsys
+    try:
+        return _GNSSID2SATSYS[gnssid]
+    except IndexError:
+        raise Exception(f'undefined gnssid {gnssid}')
 
 def sigmask2signame(satsys, sigmask):
     ''' convert satellite system and signal mask to signal name '''
-    signame = f'satsys={satsys} sigmask={sigmask}'
-    if satsys == 'G':
-        signame = [ "L1 C/A", "L1 P", "L1 Z-tracking", "L1C(D)", "L1C(P)",
-            "L1C(D+P)", "L2 CM", "L2 CL", "L2 CM+CL", "L2 P", "L2 Z-tracking",
-            "L5 I", "L5 Q", "L5 I+Q", "", ""][sigmask]
-    elif satsys == 'R':
-        signame = [ "G1 C/A", "G1 P", "G2 C/A", "G2 P", "G1a(D)", "G1a(P)",
-            "G1a(D+P)", "G2a(D)", "G2a(P)", "G2a(D+P)", "G3 I", "G3 Q",
-            "G3 I+Q", "", "", "", ""][sigmask]
-    elif satsys == 'E':
-        signame = [ "E1 B", "E1 C", "E1 B+C", "E5a I", "E5a Q", "E5a I+Q",
-            "E5b I", "E5b Q", "E5b I+Q", "E5 I", "E5 Q", "E5 I+Q",
-            "E6 B", "E6 C", "E6 B+C", ""][sigmask]
-    elif satsys == 'C':
-        signame = [ "B1 I", "B1 Q", "B1 I+Q", "B3 I", "B3 Q", "B3 I+Q",
-            "B2 I", "B2 Q", "B2 I+Q", "", "", "", "", "", "", "", ""][sigmask]
-    elif satsys == 'J':
-        signame = [ "L1 C/A", "L1 L1C(D)", "L1 L1C(P)", "L1 L1C(D+P)",
-            "L2 L2C(M)", "L2 L2C(L)", "L2 L2C(M+L)", "L5 I", "L5 Q",
-            "L5 I+Q", "", "", "", "", "", ""][sigmask]
-    elif satsys == 'S':
-        signame = [
-            "L1 C/A", "L5 I", "L5 Q", "L5 I+Q", "", "", "", "", "", "",
-            "", "", "", "", "", "", ""][sigmask]
-    else:
+    signames = _SIGNAMES.get(satsys)
+    if signames is None:
         raise Exception(
             f'unassigned signal name for satsys={satsys} and sigmask={sigmask}')
-    return signame
+    return signames[sigmask]
 
 def ura2dist(ura):
-    ''' converts user range accuracy (URA) code to accuracy in distance [mm] '''
+    ''' converts user range accuracy (URA) code to accuracy in distance [mm]
+        ura: 6-bit URA code in Bits or integer
+    '''
+    if not isinstance(ura, int):
+        ura = ura.u
     dist = 0.0
-    if   ura.b == '000000':   # undefined or unknown
+    if   ura == 0b000000:   # undefined or unknown
         dist = URA_INVALID
-    elif ura.b == '111111':   # URA more than 5466.5 mm
+    elif ura == 0b111111:   # URA more than 5466.5 mm
         dist = 5466.5
     else:
-        cls  = ura[4:7].u
-        val  = ura[0:4].u
+        cls  = ura & 0x3  # ura[4:7]
+        val  = ura >> 2   # ura[0:4]
         dist = 3 ** cls * (1 + val / 4) - 1
     return dist
 
+def _bits(payload):
+    ''' returns payload as an integer and its bit length for _u() and _s() '''
+    b = payload.tobytes()
+    return int.from_bytes(b, 'big'), len(b) * 8
+
+def _u(buf, nbuf, pos, bw):
+    ''' returns unsigned integer of bw bits at bit position pos of buf '''
+    return buf >> (nbuf - pos - bw) & ((1 << bw) - 1)
+
+def _s(buf, nbuf, pos, bw):
+    ''' returns two's complement integer of bw bits at bit position pos of buf '''
+    v = buf >> (nbuf - pos - bw) & ((1 << bw) - 1)
+    return v - (1 << bw) if v >> (bw - 1) else v
+
+JIT = bool(os.environ.get('LIBSSR_JIT'))  # numba kernels, opt-in as compiling outweighs short runs
+_KERNELS = {}  # name: (function, signature) of numba kernels
+
+def _kernel(signature):
+    ''' registers a numba kernel of signature, compiled at its first call
+        so that importing libssr does not load numba
+    '''
+    def register(func):
+        _KERNELS[func.__name__] = (func, signature)
+        def compile_and_call(*args):
+            _compile_kernels()
+            return globals()[func.__name__](*args)
+        return compile_and_call
+    return register
+
+def _compile_kernels():
+    ''' replaces the kernels with numba compiled ones if JIT is set, or with
+        the plain python functions without JIT or numba
+    '''
+    njit = None
+    if JIT:
+        try:
+            from numba import njit
+        except ModuleNotFoundError:
+            pass  # runs as plain python without numba
+    for name, (func, signature) in _KERNELS.items():  # callees first
+        globals()[name] = func if njit is None else njit(signature,
+            cache=True, nogil=True, error_model='numpy', boundscheck=False)(func)
+
+# the kernels below touch no Python object and release the GIL, so that
+# reading the next message may overlap with decoding in another thread
+@_kernel('int64(uint8[::1], int64, int64)')
+def _field(buf, pos, bw):
+    ''' returns field of |bw| <= 49 bits at bit position pos of byte array buf
+        bw: field bit width, negative for two's complement integer
+        buf: padded with 6 zero bytes so that a 7-byte window never exceeds it
+    '''
+    w = abs(bw)
+    i = pos >> 3
+    v = (np.int64(buf[i]) << 24) | (np.int64(buf[i + 1]) << 16) | \
+        (np.int64(buf[i + 2]) << 8) | np.int64(buf[i + 3])
+    if (pos & 7) + w <= 32:  # field within 4-byte window
+        v = (v >> (32 - (pos & 7) - w)) & ((np.int64(1) << w) - 1)
+    else:                    # wider field such as DF378, extend to 7 bytes
+        v = (v << 24) | (np.int64(buf[i + 4]) << 16) | \
+            (np.int64(buf[i + 5]) << 8) | np.int64(buf[i + 6])
+        v = (v >> (56 - (pos & 7) - w)) & ((np.int64(1) << w) - 1)
+    if bw < 0 and (v >> (w - 1)) & 1:  # sign extension
+        v -= np.int64(1) << w
+    return v
+
+@_kernel('int64[:, :](uint8[::1], int64, int64[::1], int64)')
+def _read_fields(buf, pos, fmt, n):
+    ''' returns n x len(fmt) array of fixed layout records at bit position pos of byte array buf
+        fmt: array of field bit width, negative for two's complement integer
+    '''
+    out = np.empty((n, len(fmt)), dtype=np.int64)
+    for i in range(n):
+        for j in range(len(fmt)):
+            out[i, j] = _field(buf, pos, fmt[j])
+            pos += abs(fmt[j])
+    return out
+
+_STEC_FMT  = np.array([-bw for bw in _STEC_BW[-1]], dtype=np.int64)  # c00 to c20
+_STEC_NC   = np.array([len(bw) for bw in _STEC_BW], dtype=np.int64)   # number of coefficients by type
+_STEC_RSBW = np.array([4, 4, 5, 7], dtype=np.int64)                    # residual bit width by size
+_STEC_LSB  = (0.04, 0.12, 0.16, 0.24)                                    # residual LSB by size
+_STEC_INV  = (  -8,   -8,  -16,  -64)                                    # invalid residual by size
+
+@_kernel('Tuple((int64, int64[:, ::1], int64[:, ::1]))(uint8[::1], int64, int64, int64, int64)')
+def _read_stec(buf, pos, end, nsat, ngrid):
+    ''' returns bit position after nsat ST12 STEC records at pos of buf, -1 if beyond end,
+        record heads (qi, type, c00, c01, c10, c11, c02, c20, size) and grid residuals
+    '''
+    head = np.zeros((nsat, 9), dtype=np.int64)
+    res  = np.zeros((nsat, ngrid), dtype=np.int64)
+    for i in range(nsat):
+        if end < pos + 6 + 2:
+            return -1, head, res
+        head[i, 0] = _field(buf, pos    , 6)  # STEC quality indication
+        head[i, 1] = _field(buf, pos + 6, 2)  # STEC correction type
+        pos += 8
+        nc = _STEC_NC[head[i, 1]]
+        nb = 0
+        for j in range(nc):
+            nb -= _STEC_FMT[j]
+        if end < pos + nb + 2:
+            return -1, head, res
+        for j in range(nc):
+            head[i, 2 + j] = _field(buf, pos, _STEC_FMT[j])
+            pos -= _STEC_FMT[j]
+        head[i, 8] = _field(buf, pos, 2)      # STEC residual size
+        pos += 2
+        bw = _STEC_RSBW[head[i, 8]]
+        if end < pos + bw * ngrid:
+            return -1, head, res
+        for j in range(ngrid):
+            res[i, j] = _field(buf, pos, -bw)
+            pos += bw
+    return pos, head, res
+
+def _buffer(payload):
+    ''' returns payload as a byte array for the kernels, writable for their signatures
+        and padded for the 7-byte window of _field()
+    '''
+    return np.frombuffer(bytearray(payload.tobytes() + bytes(6)), dtype=np.uint8)
+
+def _records(payload, fmt, n):
+    ''' returns columns of n fixed layout records read from payload
+        fmt: tuple of field bit width, negative for two's complement integer
+    '''
+    if any(49 < abs(bw) for bw in fmt):
+        raise Exception(f'SSR field too wide for _field(): {fmt}')
+    stride = sum(abs(bw) for bw in fmt)
+    pos = payload.pos
+    if len(payload) < pos + stride * n:
+        raise Exception(f'short SSR message: {len(payload)} < {pos + stride * n} bits')
+    if n == 0:  # no satellite selected by mask
+        return [np.empty(0, dtype=np.int64) for _ in fmt]
+    fields = _read_fields(_buffer(payload), pos, np.array(fmt, dtype=np.int64), n)
+    payload.pos = pos + stride * n
+    return [fields[:, j] for j in range(len(fmt))]
+
+def _read_mask(payload, n):
+    ''' returns n-bit mask read from payload as an integer, first satellite at MSB '''
+    return payload.read(n).u if n else 0
+
+def _unpack_mask(bits):
+    ''' returns uint8 array of 0 or 1 from bit mask '''
+    return np.unpackbits(np.frombuffer(bits.tobytes(), dtype=np.uint8))[:len(bits)]
+
+@_kernel('UniTuple(int64[::1], 3)(uint8[::1], int64[::1], int64[::1])')
+def _walk_mask(cellmask, nsat, nsig):
+    ''' returns GNSS, satellite and signal indices of the cells set in cell mask
+        cellmask: cell masks of all GNSS concatenated in a uint8 array
+        nsat, nsig: arrays of numbers of satellites and signals of each GNSS
+    '''
+    ncell = 0
+    for b in cellmask:
+        ncell += b != 0
+    isys = np.empty(ncell, dtype=np.int64)
+    isat = np.empty(ncell, dtype=np.int64)
+    isig = np.empty(ncell, dtype=np.int64)
+    n   = 0
+    pos = 0
+    for i in range(len(nsat)):
+        for j in range(nsat[i]):
+            for k in range(nsig[i]):
+                if cellmask[pos]:
+                    isys[n] = i
+                    isat[n] = j
+                    isig[n] = k
+                    n += 1
+                pos += 1
+    return isys, isat, isig
+
+if JIT and os.environ.get('LIBSSR_JIT_WARMUP'):  # compile at import instead of first use
+    _compile_kernels()
 
 class Ssr:
     """class of state space representation (SSR) and compact SSR process"""
-    subtype    = 0      # subtype number
-    ssr_nsat   = 0      # number of satellites
-    ssr_mmi    = 0      # multiple message indicator
-    ssr_iod    = 0      # iod ssr
-    epoch      = 0      # epoch
-    hepoch     = 0      # hourly epoch
-    interval   = 0      # update interval
-    mmi        = 0      # multiple message indication
-    satsys     = []     # array of satellite system
-    nsatmask   = []     # array of number of satellite mask
-    nsigmask   = []     # array of number of signal mask
-    cellmask   = []     # array of cell mask
-    gsys       = {}     # dict of sat    name from system name
-    gsig       = {}     # dict of signal name from system name
-    stat       = False  # statistics output
-    stat_nsat  = 0      # stat: number of satellites
-    stat_nsig  = 0      # stat: number of signals
-    stat_bsat  = 0      # stat: bit number of satellites
-    stat_bsig  = 0      # stat: bit number of signals
-    stat_both  = 0      # stat: bit number of other information
-    stat_bnull = 0      # stat: bit number of null
+    __slots__ = (
+        'trace', 'msgnum', 'subtype',
+        'ssr_epoch', 'ssr_interval', 'ssr_mmi', 'ssr_iod', 'ssr_sdat',
+        'ssr_pid', 'ssr_sid', 'ssr_nsat',
+        'epoch', 'hepoch', 'interval', 'ui', 'mmi', 'iodssr',
+        'satsys', 'nsatmask', 'nsigmask', 'cellmask', 'cells', 'gsys', 'gsig',
+        'sat_layout',
+        'region_id', 'region_alert', 'len_msg', 'n_areas', 'area', 'stec_type',
+        'n_gps', 'n_glo', 'n_gal', 'n_bds', 'n_qzs',
+        'stat', 'stat_nsat', 'stat_nsig', 'stat_bsat', 'stat_bsig',
+        'stat_both', 'stat_bnull',
+    )
 
     def __init__(self, trace):
-        self.trace = trace
+        self.trace        = trace
+        self.msgnum       = 0      # message number
+        self.subtype      = 0      # subtype number
+        self.ssr_epoch    = 0      # epoch time of RTCM SSR
+        self.ssr_interval = 0      # update interval of RTCM SSR
+        self.ssr_mmi      = 0      # multiple message indicator
+        self.ssr_iod      = 0      # iod ssr
+        self.ssr_sdat     = 0      # satellite reference datum
+        self.ssr_pid      = 0      # SSR provider ID
+        self.ssr_sid      = 0      # SSR solution ID
+        self.ssr_nsat     = 0      # number of satellites
+        self.epoch        = 0      # epoch
+        self.hepoch       = 0      # hourly epoch
+        self.interval     = 0      # update interval
+        self.ui           = 0      # update interval index
+        self.mmi          = 0      # multiple message indication
+        self.iodssr       = 0      # IOD SSR
+        self.satsys       = []     # array of satellite system
+        self.nsatmask     = []     # array of number of satellite mask
+        self.nsigmask     = []     # array of number of signal mask
+        self.cellmask     = []     # array of cell mask
+        self.cells        = []     # list of (satsys, satellite index, satellite, signal) of masked cells
+        self.gsys         = {}     # dict of sat    name from system name
+        self.gsig         = {}     # dict of signal name from system name
+        self.sat_layout   = ()     # tuple of (satsys, satellite names, number of satellites)
+        self.region_id    = 0      # MADOCA-PPP region ID
+        self.region_alert = 0      # MADOCA-PPP region alert
+        self.len_msg      = 0      # MADOCA-PPP message length in bits
+        self.n_areas      = 0      # MADOCA-PPP number of areas
+        self.area         = 0      # MADOCA-PPP STEC area number
+        self.stec_type    = 0      # MADOCA-PPP STEC correction type
+        self.n_gps        = 0      # MADOCA-PPP number of GPS satellites
+        self.n_glo        = 0      # MADOCA-PPP number of GLONASS satellites
+        self.n_gal        = 0      # MADOCA-PPP number of Galileo satellites
+        self.n_bds        = 0      # MADOCA-PPP number of BeiDou satellites
+        self.n_qzs        = 0      # MADOCA-PPP number of QZSS satellites
+        self.stat         = False  # statistics output
+        self.stat_nsat    = 0      # stat: number of satellites
+        self.stat_nsig    = 0      # stat: number of signals
+        self.stat_bsat    = 0      # stat: bit number of satellites
+        self.stat_bsig    = 0      # stat: bit number of signals
+        self.stat_both    = 0      # stat: bit number of other information
+        self.stat_bnull   = 0      # stat: bit number of null
 
     def ssr_decode_head(self, payload, satsys, mtype):
         ''' stores ssr_epoch, ssr_interval, ssr_mmi, ssr_iod, ssr_nsat'''
@@ -208,115 +437,143 @@ class Ssr:
     def ssr_decode_orbit(self, payload, satsys):
         ''' decodes SSR orbit correction and returns string '''
         # bit format of satid changes according to satellite system
-        if   satsys == 'J': bw = 4  # ref. [2]
-        elif satsys == 'R': bw = 5  # ref. [1]
-        else:               bw = 6  # ref. [1]
-        msg1 = self.trace.msg(1, '\nSAT radial[m] along[m] cross[m] d_radial[m/s] d_along[m/s] d_cross[m/s]')
+        bw = _SATID_BW.get(satsys, 6)
+        show1 = self.trace.t_level >= 1
+        msg1 = [self.trace.msg(1, '\nSAT radial[m] along[m] cross[m] d_radial[m/s] d_along[m/s] d_cross[m/s]')]
         strsat = ''
-        for _ in range(self.ssr_nsat):
-            satid   = payload.read(bw).u  # satellite ID, DF068
-            iode    = payload.read( 8).u  # IODE, DF071
-            radial  = payload.read(22).i  # radial, DF365
-            along   = payload.read(20).i  # along track, DF366
-            cross   = payload.read(20).i  # cross track, DF367
-            dradial = payload.read(21).i  # dot_radial, DF368
-            dalong  = payload.read(19).i  # dot_along track, DF369
-            dcross  = payload.read(19).i  # dot_cross track, DF370
+        iode = 0
+        (satids, iodes, radials, alongs, crosses, dradials, dalongs, dcrosses
+        ) = _records(payload, (
+            bw,   # satellite ID, DF068
+             8,   # IODE, DF071
+           -22,   # radial, DF365
+           -20,   # along track, DF366
+           -20,   # cross track, DF367
+           -21,   # dot_radial, DF368
+           -19,   # dot_along track, DF369
+           -19,   # dot_cross track, DF370
+        ), self.ssr_nsat)
+        radials  = (radials  * 1e-4).tolist()
+        alongs   = (alongs   * 4e-4).tolist()
+        crosses  = (crosses  * 4e-5).tolist()
+        dradials = (dradials * 1e-6).tolist()
+        dalongs  = (dalongs  * 4e-6).tolist()
+        dcrosses = (dcrosses * 4e-6).tolist()
+        for satid, iode, radial, along, cross, dradial, dalong, dcross in zip(
+                satids.tolist(), iodes.tolist(), radials, alongs, crosses, dradials, dalongs, dcrosses):
             strsat += f"{satsys}{satid:02} "
-            msg1 += self.trace.msg(1, f'\n{satsys}{satid:02d}   {radial*1e-4:{FMT_ORB}}  {along*4e-4:{FMT_ORB}}  {cross*4e-5:{FMT_ORB}}       {dradial*1e-6:{FMT_ORB}}      {dalong*4e-6:{FMT_ORB}}      {dcross*4e-6:{FMT_ORB}}')
-        msg = self.trace.msg(0, f"{strsat}(IOD={self.ssr_iod} IODE={iode} nsat={self.ssr_nsat}{' cont.' if self.ssr_mmi else ''})") + msg1
+            if show1:
+                msg1.append(self.trace.msg(1, _LINE_SSR_ORBIT(satsys, satid, radial, along, cross, dradial, dalong, dcross)))
+        msg = self.trace.msg(0, f"{strsat}(IOD={self.ssr_iod} IODE={iode} nsat={self.ssr_nsat}{' cont.' if self.ssr_mmi else ''})") + ''.join(msg1)
         return msg
 
     def ssr_decode_clock(self, payload, satsys):
         ''' decodes SSR clock correction and returns string '''
         # bit format of satid changes according to satellite system
-        if   satsys == 'J': bw = 4  # ref. [2]
-        elif satsys == 'R': bw = 5  # ref. [1]
-        else              : bw = 6  # ref. [1]
-        msg1 = self.trace.msg(1, '\nSAT   c0[m] c1[m/s] c2[m/s^2]')
+        bw = _SATID_BW.get(satsys, 6)
+        show1 = self.trace.t_level >= 1
+        msg1 = [self.trace.msg(1, '\nSAT   c0[m] c1[m/s] c2[m/s^2]')]
         strsat = ''
-        for _ in range(self.ssr_nsat):
-            satid = payload.read(bw).u  # satellite ID
-            c0    = payload.read(22).i  # delta clock c0, DF376
-            c1    = payload.read(21).i  # delta clock c1, DF377
-            c2    = payload.read(27).i  # delta clock c2, DF378
+        satids, c0s, c1s, c2s = _records(payload, (
+            bw,   # satellite ID
+           -22,   # delta clock c0, DF376
+           -21,   # delta clock c1, DF377
+           -27,   # delta clock c2, DF378
+        ), self.ssr_nsat)
+        c0s = (c0s * 1e-4).tolist()
+        c1s = (c1s * 1e-6).tolist()
+        c2s = (c2s * 2e-8).tolist()
+        for satid, c0, c1, c2 in zip(satids.tolist(), c0s, c1s, c2s):
             strsat += f"{satsys}{satid:02d} "
-            msg1 += self.trace.msg(1, f'\n{satsys}{satid:02d} {c0*1e-4:{FMT_CLK}} {c1*1e-6:{FMT_CLK}}   {c2*2e-8:{FMT_CLK}}')
-        msg = self.trace.msg(0, f"{strsat}(nsat={self.ssr_nsat} iod={self.ssr_iod}{' cont.' if self.ssr_mmi else ''})") + msg1
+            if show1:
+                msg1.append(self.trace.msg(1, _LINE_SSR_CLOCK(satsys, satid, c0, c1, c2)))
+        msg = self.trace.msg(0, f"{strsat}(nsat={self.ssr_nsat} iod={self.ssr_iod}{' cont.' if self.ssr_mmi else ''})") + ''.join(msg1)
         return msg
 
     def ssr_decode_code_bias(self, payload, satsys):
         ''' decodes SSR code bias and returns string '''
         # bit format of satid changes according to satellite system
-        if   satsys == 'J': bw = 4   # ref. [2]
-        elif satsys == 'R': bw = 5   # ref. [1]
-        else              : bw = 6   # ref. [1]
-        msg1 = self.trace.msg(1, '\nSAT signal_name code_bias[m]')
+        bw = _SATID_BW.get(satsys, 6)
+        show1 = self.trace.t_level >= 1
+        msg1 = [self.trace.msg(1, '\nSAT signal_name code_bias[m]')]
         strsat = ''
+        buf, nbuf = _bits(payload)
+        len_payload = len(payload)
+        pos = payload.pos
         for _ in range(self.ssr_nsat):
-            satid = payload.read(bw).u  # satellite ID, DF068, ...
-            ncb   = payload.read( 5).u  # code bias number, DF383
+            if len_payload < pos + bw + 5:
+                raise Exception(f'short SSR code bias message: {len_payload} bits')
+            satid = _u(buf, nbuf, pos, bw); pos += bw  # satellite ID, DF068, ...
+            ncb   = _u(buf, nbuf, pos,  5); pos +=  5  # code bias number, DF383
             strsat += f"{satsys}{satid:02d} "
             for j in range(ncb):
-                stmi  = payload.read( 5).u  # sig&trk mode ind, DF380
-                cb    = payload.read(14).i  # code bias, DF383
+                if len_payload < pos + 5 + 14:
+                    raise Exception(f'short SSR code bias message: {len_payload} bits')
+                stmi  = _u(buf, nbuf, pos,  5); pos +=  5  # sig&trk mode ind, DF380
+                cb    = _s(buf, nbuf, pos, 14); pos += 14  # code bias, DF383
                 sstmi = sigmask2signame(satsys, stmi)
-                msg1 += self.trace.msg(1, f'\n{satsys}{satid:02d} {sstmi:{FMT_GSIG}}    {cb*1e-2:{FMT_CB}}')
-        msg = self.trace.msg(0, f"{strsat}(IOD={self.ssr_iod} nsat={self.ssr_nsat}{' cont.' if self.ssr_mmi else ''})") + msg1
+                if show1:
+                    msg1.append(self.trace.msg(1, _LINE_SSR_CB(satsys, satid, sstmi, cb*1e-2)))
+        payload.pos = pos
+        msg = self.trace.msg(0, f"{strsat}(IOD={self.ssr_iod} nsat={self.ssr_nsat}{' cont.' if self.ssr_mmi else ''})") + ''.join(msg1)
         return msg
 
     def ssr_decode_ura(self, payload, satsys):
         ''' decodes SSR user range accuracy and returns string '''
         # bit format of satid changes according to satellite system
-        if   satsys == 'J': bw = 4  # ref. [2]
-        elif satsys == 'R': bw = 5  # ref. [1]
-        else              : bw = 6  # ref. [1]
-        msg1 = self.trace.msg(1, '\nSAT URA[mm]')
+        bw = _SATID_BW.get(satsys, 6)
+        show1 = self.trace.t_level >= 1
+        msg1 = [self.trace.msg(1, '\nSAT URA[mm]')]
         strsat = ''
+        buf, nbuf = _bits(payload)
+        len_payload = len(payload)
+        pos = payload.pos
         for i in range(self.ssr_nsat):
-            satid = payload.read(bw).u  # satellite ID, DF068
-            ura   = payload.read( 6)  # user range accuracy, DF389
+            if len_payload < pos + bw + 6:
+                raise Exception(f'short SSR URA message: {len_payload} bits')
+            satid = _u(buf, nbuf, pos, bw); pos += bw  # satellite ID, DF068
+            ura   = _u(buf, nbuf, pos,  6); pos +=  6  # user range accuracy, DF389
             accuracy = ura2dist(ura)
             if accuracy != URA_INVALID:
-                msg1 += self.trace.msg(1, f'\n{satsys}{satid:02d} {accuracy:{FMT_URA}}')
+                if show1:
+                    msg1.append(self.trace.msg(1, _LINE_SSR_URA(satsys, satid, accuracy)))
                 strsat += f"{satsys}{satid:02} "
-        msg = self.trace.msg(0, f"{strsat}(IOD={self.ssr_iod} nsat={self.ssr_nsat}{' cont.' if self.ssr_mmi else ''})") + msg1
+        payload.pos = pos
+        msg = self.trace.msg(0, f"{strsat}(IOD={self.ssr_iod} nsat={self.ssr_nsat}{' cont.' if self.ssr_mmi else ''})") + ''.join(msg1)
         return msg
 
     def ssr_decode_hr_clock(self, payload, satsys):
         '''decodes SSR high rate clock and returns string'''
         # bit format of satid changes according to satellite system
-        if   satsys == 'J': bw = 4
-        elif satsys == 'R': bw = 5
-        else              : bw = 6
-        msg1 = self.trace.msg(1, '\nSAT high_rate_clock[m]')
+        bw = _SATID_BW.get(satsys, 6)
+        show1 = self.trace.t_level >= 1
+        msg1 = [self.trace.msg(1, '\nSAT high_rate_clock[m]')]
         strsat = ''
-        for _ in range(self.ssr_nsat):
-            satid = payload.read(bw).u  # satellite ID
-            hrc   = payload.read(22).i  # high rate clock, DF390
+        satids, hrcs = _records(payload, (
+            bw,   # satellite ID
+           -22,   # high rate clock, DF390
+        ), self.ssr_nsat)
+        for satid, hrc in zip(satids.tolist(), (hrcs * 1e-4).tolist()):
             strsat += f"{satsys}{satid:02} "
-            msg1 += self.trace.msg(1, f'\n{satsys}{satid:02}            {hrc*1e-4:{FMT_CLK}}')
-        msg = self.trace.msg(0, f"{strsat}(IOD={self.ssr_iod} nsat={self.ssr_nsat}{' cont.' if self.ssr_mmi else ''})") + msg1
+            if show1:
+                msg1.append(self.trace.msg(1, _LINE_SSR_HRC(satsys, satid, hrc)))
+        msg = self.trace.msg(0, f"{strsat}(IOD={self.ssr_iod} nsat={self.ssr_nsat}{' cont.' if self.ssr_mmi else ''})") + ''.join(msg1)
         return msg
 
+    def ssr_decode(self, payload, satsys, mtype):
+        ''' calls decode function of the RTCM SSR message type and returns message,
+            or None for unknown message type
+        '''
+        decode = self._SSR_DISPATCH.get(mtype)
+        if decode is None:
+            return None
+        return decode(self, payload, satsys)
+
     def decode_cssr(self, payload):
         ''' calls cssr decode functions and returns decoded string '''
         if not self.decode_cssr_head(payload):
             return 'Could not decode CSSR header'
-        if   self.subtype ==  1: self.decode_cssr_st1 (payload)
-        elif self.subtype ==  2: self.decode_cssr_st2 (payload)
-        elif self.subtype ==  3: self.decode_cssr_st3 (payload)
-        elif self.subtype ==  4: self.decode_cssr_st4 (payload)
-        elif self.subtype ==  5: self.decode_cssr_st5 (payload)
-        elif self.subtype ==  6: self.decode_cssr_st6 (payload)
-        elif self.subtype ==  7: self.decode_cssr_st7 (payload)
-        elif self.subtype ==  8: self.decode_cssr_st8 (payload)
-        elif self.subtype ==  9: self.decode_cssr_st9 (payload)
-        elif self.subtype == 10: self.decode_cssr_st10(payload)
-        elif self.subtype == 11: self.decode_cssr_st11(payload)
-        elif self.subtype == 12: self.decode_cssr_st12(payload)
-        else:
-            raise Exception(f"unknown CSSR subtype: {self.subtype}")
+        self.decode_cssr_st(payload)
         msg = f'ST{self.subtype:<2d}'
         if self.subtype == 1:
             msg += f' Epoch={epoch2timedate(self.epoch)} ({self.epoch}) UI={CSSR_UI[self.ui]:2d}s ({self.ui}) IODSSR={self.iodssr} {"cont." if self.mmi else ""}'
@@ -325,6 +582,13 @@ class Ssr:
             msg += f' Epoch={etime} ({self.hepoch}) UI={CSSR_UI[self.ui]:2d}s ({self.ui}) IODSSR={self.iodssr}{" cont." if self.mmi else ""}'
         return msg
 
+    def decode_cssr_st(self, payload):
+        ''' calls decode function of the subtype and returns True if success '''
+        decode = self._ST_DISPATCH.get(self.subtype)
+        if decode is None:
+            raise Exception(f"unknown CSSR subtype: {self.subtype}")
+        return decode(self, payload)
+
     def show_cssr_stat(self):
         bit_total = self.stat_bsat + self.stat_bsig + self.stat_both + \
                 self.stat_bnull
@@ -339,8 +603,8 @@ class Ssr:
         self.msgnum  = 0
         self.subtype = 0
         len_payload = len(payload)
-        if payload.all(0):  # payload is zero padded
-            self.trace.show(2, f"CSSR null data {len(payload.bin)} bits", fg='green')
+        if not payload.any(1):  # payload is zero padded
+            self.trace.show(2, f"CSSR null data {len_payload} bits", fg='green')
             return False
         if len_payload < payload.pos + 12:
             return False
@@ -365,7 +629,7 @@ class Ssr:
             self.mmi    = payload.read(1).u  # multiple message indication
             self.iodssr = payload.read(4).u  # IOD SSR
             return True
-        self.trace.show(0, f"CSSR msgnum should be 4073 ({self.msgnum}), size {len(payload.bin)} bits\nCSSR dump: {payload.bin}", fg='red')
+        self.trace.show(0, f"CSSR msgnum should be 4073 ({self.msgnum}), size {len_payload} bits\nCSSR dump: {payload.bin}", fg='red')
         return False
 
     def _decode_mask(self, payload, ssr_type):
@@ -377,7 +641,7 @@ class Ssr:
         len_payload = len(payload)
         if len_payload < payload.pos + 4:
             return False
-        ngnss = payload.read('u4')  # number of GNSS
+        ngnss = payload.read(4).u  # number of GNSS
         if len_payload < payload.pos + 61 * ngnss:
             return False
         satsys   = [None for i in range(ngnss)]
@@ -393,23 +657,15 @@ class Ssr:
             bsigmask  = payload.read(16)
             cmavail   = payload.read( 1).u
             t_satsys  = gnssid2satsys(ugnssid)
-            t_satmask = 0
-            t_sigmask = 0
-            t_gsys = []
-            t_gsig = []
-            for i, val in enumerate(bsatmask):
-                if val:
-                    t_satmask += 1
-                    t_gsys.append(f'{t_satsys}{i + 1:02d}')
-            for i, val in enumerate(bsigmask):
-                if val:
-                    t_sigmask += 1
-                    t_gsig.append(sigmask2signame(t_satsys, i))
+            t_gsys = [f'{t_satsys}{i + 1:02d}' for i in np.flatnonzero(_unpack_mask(bsatmask)).tolist()]
+            t_gsig = [sigmask2signame(t_satsys, i) for i in np.flatnonzero(_unpack_mask(bsigmask)).tolist()]
+            t_satmask = len(t_gsys)
+            t_sigmask = len(t_gsig)
             ncell = t_satmask * t_sigmask
             if cmavail:
-                bcellmask = payload.read(ncell)
+                bcellmask = _unpack_mask(payload.read(ncell))
             else:
-                bcellmask = bitstring.ConstBitStream('0b1') * ncell
+                bcellmask = np.ones(ncell, dtype=np.uint8)
             nm = 0  # navigation message (HAS)
             if ssr_type == 'has':
                 nm = payload.read(3).u
@@ -428,27 +684,29 @@ class Ssr:
         self.cellmask  = cellmask  # cell mask
         self.gsys      = gsys      # dict of sat    name from system name
         self.gsig      = gsig      # dict of signal name from system name
-        self.stat_nsat = 0
-        self.stat_nsig = 0
-        msg1 = ''
-        for i, satsys in enumerate(self.satsys):
-            pos_mask = 0  # mask position
-            for j, gsys in enumerate(self.gsys[satsys]):
-                self.stat_nsat += 1
-                if ssr_type == 'cssr':
-                    msg1 += 'ST1 ' + gsys
-                else:
-                    msg1 += 'MASK ' + gsys
-                for gsig in self.gsig[satsys]:
-                    mask = self.cellmask[i][pos_mask]; pos_mask += 1
-                    if not mask:
-                        continue
-                    msg1 += ' ' + gsig
-                    self.stat_nsig += 1
-                msg1 += '\n'
-            if ssr_type == 'has' and navmsg[i] != 0:
-                msg1 += '\n{satsys}: NavMsg should be zero.\n'
-        self.trace.show(1, msg1, end='')
+        self.stat_nsat = sum(nsatmask)
+        self.stat_nsig = int(sum(mask.sum() for mask in cellmask))
+        self.cells     = self._cells()
+        self.sat_layout = tuple((s, tuple(gsys[s]), len(gsys[s])) for s in satsys)
+        if self.trace.t_level >= 1:
+            msg1 = []
+            for i, satsys in enumerate(self.satsys):
+                t_cellmask = cellmask[i]
+                t_gsig     = gsig[satsys]
+                pos_mask   = 0  # mask position
+                for t_gsys in gsys[satsys]:
+                    if ssr_type == 'cssr':
+                        msg1.append('ST1 ' + t_gsys)
+                    else:
+                        msg1.append('MASK ' + t_gsys)
+                    for t_sig in t_gsig:
+                        mask = t_cellmask[pos_mask]; pos_mask += 1
+                        if mask:
+                            msg1.append(' ' + t_sig)
+                    msg1.append('\n')
+                if ssr_type == 'has' and navmsg[i] != 0:
+                    msg1.append('\n{satsys}: NavMsg should be zero.\n')
+            self.trace.show(1, ''.join(msg1), end='')
         if self.stat:
             self.show_cssr_stat()
         self.stat_bsat  = 0
@@ -457,6 +715,20 @@ class Ssr:
         self.stat_bnull = 0
         return True
 
+    def _cells(self):
+        ''' returns list of (satsys, satellite index, satellite, signal) of masked cells '''
+        if not self.cellmask:
+            return []
+        isys, isat, isig = _walk_mask(
+            np.concatenate(self.cellmask),
+            np.array(self.nsatmask, dtype=np.int64),
+            np.array(self.nsigmask, dtype=np.int64))
+        satsys = self.satsys
+        gsys   = [self.gsys[s] for s in satsys]
+        gsig   = [self.gsig[s] for s in satsys]
+        return [(satsys[i], j, gsys[i][j], gsig[i][k])
+            for i, j, k in zip(isys.tolist(), isat.tolist(), isig.tolist())]
+
     def decode_cssr_st1(self, payload):
         ''' decode CSSR ST1 mask message and returns True if success '''
         return self._decode_mask(payload, 'cssr')
@@ -469,10 +741,11 @@ class Ssr:
         ''' decode CSSR ST2 orbit message and returns True if success '''
         len_payload = len(payload)
         stat_pos    = payload.pos
-        msg1  = 'ST2 SAT IODE radial[m] along[m] cross[m]'
-        for satsys in self.satsys:
-            bw = 10 if satsys == 'E' else 8  # IODE bit width
-            for gsys in self.gsys[satsys]:
+        show1 = self.trace.t_level >= 1
+        msg1 = ['ST2 SAT IODE radial[m] along[m] cross[m]']
+        for satsys, t_gsys, _ in self.sat_layout:
+            bw = _IODE_BW.get(satsys, 8)
+            for gsys in t_gsys:
                 if len_payload < payload.pos + bw + 15 + 13 + 13:
                     return False
                 iode   = payload.read(bw).u
@@ -480,8 +753,9 @@ class Ssr:
                 along  = payload.read(13).i
                 cross  = payload.read(13).i
                 if radial != -16384 and along != -4096 and cross != -4096:
-                    msg1 += f'\nST2 {gsys} {iode:{FMT_IODE}}   {radial*0.0016:{FMT_ORB}}  {along*0.0064:{FMT_ORB}}  {cross*0.0064:{FMT_ORB}}'
-        self.trace.show(1, msg1)
+                    if show1:
+                        msg1.append(_LINE_ORBIT('ST2', gsys, iode, radial*0.0016, along*0.0064, cross*0.0064))
+        self.trace.show(1, ''.join(msg1))
         self.stat_both += stat_pos
         self.stat_bsat += payload.pos - stat_pos
         return True
@@ -492,20 +766,22 @@ class Ssr:
         stat_pos    = payload.pos
         if len_payload < payload.pos + 4:
             return False
-        vi = payload.read('u4')
-        msg1 = f'ORBIT SAT IODE radial[m] along[m] cross[m] validity_interval={HAS_VI[vi]}s ({vi})'
-        for satsys in self.satsys:
-            bw = 10 if satsys == 'E' else 8
-            for gsys in self.gsys[satsys]:
+        vi = payload.read(4).u
+        show1 = self.trace.t_level >= 1
+        msg1 = [f'ORBIT SAT IODE radial[m] along[m] cross[m] validity_interval={HAS_VI[vi]}s ({vi})']
+        for satsys, t_gsys, _ in self.sat_layout:
+            bw = _IODE_BW.get(satsys, 8)
+            for gsys in t_gsys:
                 if len_payload < payload.pos + bw + 13 + 12 + 12:
                     return False
                 iode = payload.read(bw).u
-                radial = payload.read(13)
-                along  = payload.read(12)
-                cross  = payload.read(12)
-                if radial.b != '1000000000000' and along.b != '100000000000' and cross.b != '100000000000':
-                    msg1 += f'\nORBIT {gsys} {iode:{FMT_IODE}}   {radial.i*0.0025:{FMT_ORB}}  {along.i*0.0080:{FMT_ORB}}  {cross.i*0.0080:{FMT_ORB}}'
-        self.trace.show(1, msg1)
+                radial = payload.read(13).i
+                along  = payload.read(12).i
+                cross  = payload.read(12).i
+                if radial != -4096 and along != -2048 and cross != -2048:
+                    if show1:
+                        msg1.append(_LINE_ORBIT('ORBIT', gsys, iode, radial*0.0025, along*0.0080, cross*0.0080))
+        self.trace.show(1, ''.join(msg1))
         self.stat_both += stat_pos
         self.stat_bsat += payload.pos - stat_pos
         return True
@@ -514,15 +790,17 @@ class Ssr:
         ''' decode CSSR ST3 clock message and returns True if success '''
         len_payload = len(payload)
         stat_pos    = payload.pos
-        msg1 = 'ST3 SAT   c0[m]'
-        for satsys in self.satsys:
-            for gsys in self.gsys[satsys]:
+        show1 = self.trace.t_level >= 1
+        msg1 = ['ST3 SAT   c0[m]']
+        for satsys, t_gsys, _ in self.sat_layout:
+            for gsys in t_gsys:
                 if len_payload < payload.pos + 15:
                     return False
                 c0 = payload.read(15).i
                 if c0 != -16384:
-                    msg1 += f"\nST3 {gsys} {c0*1.6e-3:{FMT_CLK}}"
-        self.trace.show(1, msg1)
+                    if show1:
+                        msg1.append(_LINE_CLOCK('ST3', gsys, c0*1.6e-3))
+        self.trace.show(1, ''.join(msg1))
         self.stat_both += stat_pos
         self.stat_bsat += payload.pos - stat_pos
         return True
@@ -534,20 +812,22 @@ class Ssr:
         if len_payload < payload.pos + 4:
             return False
         vi = payload.read(4).u
-        msg1 = f'CKFUL SAT   c0[m] validity_interval={HAS_VI[vi]}[s] ({vi})'
+        show1 = self.trace.t_level >= 1
+        msg1 = [f'CKFUL SAT   c0[m] validity_interval={HAS_VI[vi]}[s] ({vi})']
         if len_payload < payload.pos + 2 * len(self.satsys):
             return False
         multiplier = [1 for i in range(len(self.satsys))]
         for i, satsys in enumerate(self.satsys):
             multiplier[i] = payload.read(2).u + 1
-        for i, satsys in enumerate(self.satsys):
-            for gsys in self.gsys[satsys]:
+        for i, (_, t_gsys, _) in enumerate(self.sat_layout):
+            for gsys in t_gsys:
                 if len_payload < payload.pos + 13:
                     return False
-                c0 = payload.read(13)
-                if c0.b != '1000000000000' and c0.b != '0111111111111':
-                    msg1 += f"\nCKFUL {gsys} {c0.i*2.5e-3*multiplier[i]:{FMT_CLK}}"
-        self.trace.show(1, msg1)
+                c0 = payload.read(13).i
+                if c0 != -4096 and c0 != 4095:
+                    if show1:
+                        msg1.append(_LINE_CLOCK('CKFUL', gsys, c0*2.5e-3*multiplier[i]))
+        self.trace.show(1, ''.join(msg1))
         self.stat_both += stat_pos
         self.stat_bsat += payload.pos - stat_pos
         return True
@@ -560,7 +840,8 @@ class Ssr:
             return False
         vi = payload.read(4).u
         ns = payload.read(2).u  # GNSS subset number
-        msg1 = f'CKSUB SAT   c0[m] validity_interval={HAS_VI[vi]}[s] ({vi}), gnss_subset_number={ns}'
+        show1 = self.trace.t_level >= 1
+        msg1 = [f'CKSUB SAT   c0[m] validity_interval={HAS_VI[vi]}[s] ({vi}), gnss_subset_number={ns}']
         multiplier = [1 for i in range(len(self.satsys))]
         for i in range(ns):
             if len_payload < payload.pos + 4 + 2:
@@ -571,10 +852,11 @@ class Ssr:
                 for gsig in self.gsig[satsys]:
                     if len_payload < payload.pos + 13:
                         return False
-                    c0 = payload.read(13)
-                    if c0.b != '1000000000000' and c0.b == '0111111111111':
-                        msg1 += f"\nCKSUB {gsys} {c0.i*2.5e-3*multiplier:{FMT_CLK}}"
-        self.trace.show(1, msg1)
+                    c0 = payload.read(13).i
+                    if c0 != -4096 and c0 == 4095:
+                        if show1:
+                            msg1.append(_LINE_CLOCK('CKSUB', gsys, c0*2.5e-3*multiplier))
+        self.trace.show(1, ''.join(msg1))
         self.stat_both += stat_pos
         self.stat_bsat += payload.pos - stat_pos
         return True
@@ -587,27 +869,21 @@ class Ssr:
             raise Exception(f'unknow ssr_type: {ssr_type}')
         len_payload = len(payload)
         stat_pos    = payload.pos
-        msg1 = 'ST4 SAT sinal_name      code_bias[m]'
+        show1 = self.trace.t_level >= 1
+        msg1 = ['ST4 SAT sinal_name      code_bias[m]']
         if ssr_type == 'has':
             if len_payload < payload.pos + 4:
                 return False
             vi = payload.read(4).u
-            msg1 = f'CBIAS SAT signal_name     code_bias[m] validity_interval={HAS_VI[vi]}s ({vi})'
-        for i, satsys in enumerate(self.satsys):
-            pos_mask = 0  # mask position
-            for gsys in self.gsys[satsys]:
-                for gsig in self.gsig[satsys]:
-                    mask = self.cellmask[i][pos_mask]; pos_mask += 1
-                    if not mask:
-                        continue
-                    if len_payload < payload.pos + 11:
-                        return False
-                    cb = payload.read(11).i
-                    if cb != -1024:
-                        if ssr_type == "cssr": msg1 += "\nST4"
-                        else                 : msg1 += "\nCBIAS"
-                        msg1 += f" {gsys} {gsig:{FMT_GSIG}}        {cb*0.02:{FMT_CB}}"
-        self.trace.show(1, msg1)
+            msg1 = [f'CBIAS SAT signal_name     code_bias[m] validity_interval={HAS_VI[vi]}s ({vi})']
+        prefix = 'ST4' if ssr_type == 'cssr' else 'CBIAS'
+        if len_payload < payload.pos + 11 * len(self.cells):
+            return False
+        for _, _, gsys, gsig in self.cells:
+            cb = payload.read(11).i
+            if cb != -1024 and show1:
+                msg1.append(_LINE_CB(prefix, gsys, gsig, cb*0.02))
+        self.trace.show(1, ''.join(msg1))
         self.stat_both += stat_pos
         self.stat_bsig += payload.pos - stat_pos
         return True
@@ -624,21 +900,17 @@ class Ssr:
         ''' decode CSSR ST5 phase bias message and returns True if success '''
         len_payload = len(payload)
         stat_pos    = payload.pos
-        msg1  = 'ST5 SAT signal_name phase_bias[m]       discontinuity'
-        for i, satsys in enumerate(self.satsys):
-            pos_mask = 0
-            for gsys in self.gsys[satsys]:
-                for gsig in self.gsig[satsys]:
-                    mask = self.cellmask[i][pos_mask]; pos_mask += 1
-                    if not mask:
-                        continue
-                    if len_payload < payload.pos + 15 + 2:
-                        return False
-                    pb  = payload.read(15).i
-                    di  = payload.read( 2).u
-                    if pb != -16384:
-                        msg1 += f'\nST5 {gsys} {gsig:{FMT_GSIG}}     {pb*0.001:{FMT_PB}}       {di}'
-        self.trace.show(1, msg1)
+        show1 = self.trace.t_level >= 1
+        msg1 = ['ST5 SAT signal_name phase_bias[m]       discontinuity']
+        if len_payload < payload.pos + (15 + 2) * len(self.cells):
+            return False
+        for _, _, gsys, gsig in self.cells:
+            pb  = payload.read(15).i
+            di  = payload.read( 2).u
+            if pb != -16384:
+                if show1:
+                    msg1.append(_LINE_PB('ST5', gsys, gsig, pb*0.001, di))
+        self.trace.show(1, ''.join(msg1))
         self.stat_both += stat_pos
         self.stat_bsig += payload.pos - stat_pos
         return True
@@ -650,21 +922,17 @@ class Ssr:
         if len_payload < payload.pos + 4:
             return False
         vi = payload.read(4).u
-        msg1 = f'PBIAS SAT signal_name phase_bias[cycle] discontinuity validity_interval={HAS_VI[vi]}[s] ({vi})'
-        for i, satsys in enumerate(self.satsys):
-            pos_mask = 0
-            for gsys in self.gsys[satsys]:
-                for gsig in self.gsig[satsys]:
-                    mask = self.cellmask[i][pos_mask]; pos_mask += 1
-                    if not mask:
-                        continue
-                    if len_payload < payload.pos + 11 + 2:
-                        return False
-                    pb  = payload.read(11).i
-                    di  = payload.read( 2).u
-                    if pb != -1024:
-                        msg1 += f'\nPBIAS {gsys} {gsig:{FMT_GSIG}}     {pb*0.01:{FMT_PB}}       {di}'
-        self.trace.show(1, msg1)
+        show1 = self.trace.t_level >= 1
+        msg1 = [f'PBIAS SAT signal_name phase_bias[cycle] discontinuity validity_interval={HAS_VI[vi]}[s] ({vi})']
+        if len_payload < payload.pos + (11 + 2) * len(self.cells):
+            return False
+        for _, _, gsys, gsig in self.cells:
+            pb  = payload.read(11).i
+            di  = payload.read( 2).u
+            if pb != -1024:
+                if show1:
+                    msg1.append(_LINE_PB('PBIAS', gsys, gsig, pb*0.01, di))
+        self.trace.show(1, ''.join(msg1))
         self.stat_both += stat_pos
         self.stat_bsig += payload.pos - stat_pos
         return True
@@ -679,49 +947,44 @@ class Ssr:
         f_pb = payload.read(1).u  # phase   bias existing flag
         f_nb = payload.read(1).u  # network bias existing flag
         svmask = {}
-        for satsys in self.satsys:
-            ngsys = len(self.gsys[satsys])
-            svmask[satsys] = bitstring.Bits('0b1')*ngsys
-        msg1 = f"ST6 code_bias={'on' if f_cb else 'off'} phase_bias={'on' if f_pb else 'off'} network_bias={'on' if f_nb else 'off'}"
-        msg1 += "\nST6 SAT signal_name    "
+        for satsys, _, ngsys in self.sat_layout:
+            svmask[satsys] = (1 << ngsys) - 1  # all satellites
+        show1 = self.trace.t_level >= 1
+        msg1 = [f"ST6 code_bias={'on' if f_cb else 'off'} phase_bias={'on' if f_pb else 'off'} network_bias={'on' if f_nb else 'off'}"]
+        msg1.append("\nST6 SAT signal_name    ")
         if f_cb:
-            msg1 += " code_bias[m]"
+            msg1.append(" code_bias[m]")
         if f_pb:
-            msg1 += " phase_bias[m] discontinuity"
+            msg1.append(" phase_bias[m] discontinuity")
         if f_nb:
             if len_payload < payload.pos + 5:
                 return False
-            cnid = payload.read('u5')  # compact network ID
+            cnid = payload.read(5).u  # compact network ID
             if cnid < 1 or N_NID < cnid:
                 raise Exception(f"invalid compact network ID: {cnid}")
-            msg1 += f" NID={cnid} ({CLASGRID[cnid-1][0]})"
-            for satsys in self.satsys:
-                ngsys = len(self.gsys[satsys])
+            msg1.append(f" NID={cnid} ({CLASGRID[cnid-1][0]})")
+            for satsys, _, ngsys in self.sat_layout:
                 if len_payload < payload.pos + ngsys:
                     return False
-                svmask[satsys] = payload.read(ngsys)
-        for i, satsys in enumerate(self.satsys):
-            pos_mask = 0  # mask position
-            for j, gsys in enumerate(self.gsys[satsys]):
-                for gsig in self.gsig[satsys]:
-                    mask = self.cellmask[i][pos_mask]; pos_mask += 1
-                    if not mask or not svmask[satsys][j]:
-                        continue
-                    msg1 += f"\nST6 {gsys} {gsig:{FMT_GSIG}}"
-                    if f_cb:
-                        if len_payload < payload.pos + 11:
-                            return False
-                        cb  = payload.read(11).i  # code bias
-                        if cb != -1024:
-                            msg1 += f" {cb*0.02:{FMT_CB}}"
-                    if f_pb:
-                        if len_payload < payload.pos + 15 + 2:
-                            return False
-                        pb = payload.read(15).i  # phase bias
-                        di = payload.read( 2).u  # disc ind
-                        if pb != -16384:
-                            msg1 += f"         {pb*0.001:{FMT_PB}}     {di}"
-        self.trace.show(1, msg1)
+                svmask[satsys] = _read_mask(payload, ngsys)
+        nsat = {satsys: ngsys for satsys, _, ngsys in self.sat_layout}
+        cells = [cell for cell in self.cells
+            if (svmask[cell[0]] >> (nsat[cell[0]] - 1 - cell[1])) & 1]
+        fmt = ([-11] if f_cb else []) + ([-15, 2] if f_pb else [])
+        if len_payload < payload.pos + sum(abs(bw) for bw in fmt) * len(cells):
+            return False
+        cols = _records(payload, fmt, len(cells)) if fmt else []
+        if show1:
+            cb = cols[0] if f_cb else None                 # code bias
+            pb = cols[-2] if f_pb else None                # phase bias
+            di = cols[-1] if f_pb else None                # disc ind
+            for k, (satsys, j, gsys, gsig) in enumerate(cells):
+                msg1.append(f"\nST6 {gsys} {gsig:{FMT_GSIG}}")
+                if f_cb and cb[k] != -1024:
+                    msg1.append(f" {cb[k]*0.02:{FMT_CB}}")
+                if f_pb and pb[k] != -16384:
+                    msg1.append(f"         {pb[k]*0.001:{FMT_PB}}     {di[k]}")
+        self.trace.show(1, ''.join(msg1))
         self.stat_both += stat_pos + 3
         self.stat_bsig += payload.pos - stat_pos - 3
         return True
@@ -730,16 +993,18 @@ class Ssr:
         ''' decode CSSR ST7 user range accuracy message and returns True if success '''
         len_payload = len(payload)
         stat_pos    = payload.pos
-        msg1 = 'ST7 SAT URA[mm]'
-        for satsys in self.satsys:
-            for gsys in self.gsys[satsys]:
+        show1 = self.trace.t_level >= 1
+        msg1 = ['ST7 SAT URA[mm]']
+        for satsys, t_gsys, _ in self.sat_layout:
+            for gsys in t_gsys:
                 if len_payload < payload.pos + 6:
                     return False
-                ura = payload.read(6)  # [3], Sect.4.2.2.7
+                ura = payload.read(6).u  # [3], Sect.4.2.2.7
                 accuracy = ura2dist(ura)
                 if accuracy != URA_INVALID:
-                    msg1 += f"\nST7 {gsys} {accuracy:{FMT_URA}}"
-        self.trace.show(1, msg1)
+                    if show1:
+                        msg1.append(_LINE_URA('ST7', gsys, accuracy))
+        self.trace.show(1, ''.join(msg1))
         self.stat_both += stat_pos
         self.stat_bsat += payload.pos - stat_pos
         return True
@@ -755,50 +1020,43 @@ class Ssr:
         if cnid < 1 or N_NID < cnid:
             raise Exception(f"invalid compact network ID: {cnid}")
         svmask = {}
-        for satsys in self.satsys:
-            ngsys = len(self.gsys[satsys])
+        for satsys, _, ngsys in self.sat_layout:
             if len_payload < payload.pos + ngsys:
                 return False
-            svmask[satsys] = payload.read(ngsys)
-        msg1 = "ST8 SAT qual[TECU] c00[TECU]"
+            svmask[satsys] = _read_mask(payload, ngsys)
+        show1 = self.trace.t_level >= 1
+        msg1 = ["ST8 SAT qual[TECU] c00[TECU]"]
         if 1 <= stec_type:
-            msg1 += " c01[TECU/deg] c10[TECU/deg]"
+            msg1.append(" c01[TECU/deg] c10[TECU/deg]")
         if 2 <= stec_type:
-            msg1 += " c11[TECU/deg^2]"
+            msg1.append(" c11[TECU/deg^2]")
         if 3 <= stec_type:
-            msg1 += " c02[TECU/deg^2] c20[TECU/deg^2]"
-        msg1 += f" NID={cnid} ({CLASGRID[cnid-1][0]})"
-        for satsys in self.satsys:
-            for maskpos, gsys in enumerate(self.gsys[satsys]):
-                if not svmask[satsys][maskpos]:
-                    continue
-                if len_payload < payload.pos + 6 + 14:
-                    return False
-                qi  = payload.read( 6)  # quality indicator
-                c00 = payload.read(14).i
+            msg1.append(" c02[TECU/deg^2] c20[TECU/deg^2]")
+        msg1.append(f" NID={cnid} ({CLASGRID[cnid-1][0]})")
+        sats = [gsys for satsys, t_gsys, ngsys in self.sat_layout
+            for k, gsys in enumerate(t_gsys) if (svmask[satsys] >> (ngsys - 1 - k)) & 1]
+        fmt = [6] + [-bw for bw in _STEC_BW[stec_type]]  # quality indicator, coefficients
+        if len_payload < payload.pos + sum(abs(bw) for bw in fmt) * len(sats):
+            return False
+        cols = [col.tolist() for col in _records(payload, fmt, len(sats))]
+        if show1:
+            for k, gsys in enumerate(sats):
+                qi, c00 = cols[0][k], cols[1][k]
                 if c00 != -8192:
-                    msg1 += f"\nST8 {gsys}     {ura2dist(qi):{FMT_TECU}}    {c00*0.05:{FMT_TECU}}"
+                    msg1.append(f"\nST8 {gsys}     {ura2dist(qi):{FMT_TECU}}    {c00*0.05:{FMT_TECU}}")
                 if 1 <= stec_type:
-                    if len_payload < payload.pos + 12 + 12:
-                        return False
-                    c01 = payload.read(12).i
-                    c10 = payload.read(12).i
+                    c01, c10 = cols[2][k], cols[3][k]
                     if c01 != -2048 and c10 != -2048:
-                        msg1 += f"        {c01*0.02:{FMT_TECU}}        {c10*0.02:{FMT_TECU}}"
+                        msg1.append(f"        {c01*0.02:{FMT_TECU}}        {c10*0.02:{FMT_TECU}}")
                 if 2 <= stec_type:
-                    if len_payload < payload.pos + 10:
-                        return False
-                    c11  = payload.read(10).i
+                    c11 = cols[4][k]
                     if c11 != -512:
-                        msg1 += f"          {c11*0.02:{FMT_TECU}}"
+                        msg1.append(f"          {c11*0.02:{FMT_TECU}}")
                 if 3 <= stec_type:
-                    if len_payload < payload.pos + 8 + 8:
-                        return False
-                    c02  = payload.read(8).i
-                    c20  = payload.read(8).i
+                    c02, c20 = cols[5][k], cols[6][k]
                     if c02 != -128 and c20 != -128:
-                        msg1 += f"          {c02*0.005:{FMT_TECU}}          {c20*0.005:{FMT_TECU}}"
-        self.trace.show(1, msg1)
+                        msg1.append(f"          {c02*0.005:{FMT_TECU}}          {c20*0.005:{FMT_TECU}}")
+        self.trace.show(1, ''.join(msg1))
         self.stat_both += stat_pos + 7
         self.stat_bsat += payload.pos - stat_pos - 7
         return True
@@ -814,43 +1072,43 @@ class Ssr:
         if cnid < 1 or N_NID < cnid:
             raise Exception(f"invalid compact network ID: {cnid}")
         svmask = {}
-        for satsys in self.satsys:
-            ngsys = len(self.gsys[satsys])
+        for satsys, _, ngsys in self.sat_layout:
             if len_payload < payload.pos + ngsys:
                 return False
-            svmask[satsys] = payload.read(ngsys)
+            svmask[satsys] = _read_mask(payload, ngsys)
         if len_payload < payload.pos + 6 + 6:
             return False
-        tqi   = payload.read(6)    # tropo quality indicator
+        tqi   = payload.read(6).u  # tropo quality indicator
         ngrid = payload.read(6).u  # number of grids
         if CLASGRID[cnid-1][1] != ngrid:
             raise Exception(f"cnid={cnid}, ngrid={ngrid} != {CLASGRID[cnid-1][1]}")
-        bw = 16 if srange else 7    # bit width of residual correction
+        bw  = 16 if srange else 7           # bit width of residual correction
+        inv = -32768 if srange else -64     # invalid residual correction
         CSSR_TROP_CORR_TYPE = ['Not included', 'Neill mapping function', 'Reserved', 'Reserved',]
-        msg1 = f"ST9 Trop Type: {CSSR_TROP_CORR_TYPE[tctype]} ({tctype}), resolution={bw}[bit] ({srange}), NID={cnid} ({CLASGRID[cnid-1][0]}), qual={ura2dist(tqi):{FMT_URA}}[mm], ngrid={ngrid}"
+        show1 = self.trace.t_level >= 1
+        msg1 = [f"ST9 Trop Type: {CSSR_TROP_CORR_TYPE[tctype]} ({tctype}), resolution={bw}[bit] ({srange}), NID={cnid} ({CLASGRID[cnid-1][0]}), qual={ura2dist(tqi):{FMT_URA}}[mm], ngrid={ngrid}"]
         if tctype != 1:
-            self.trace.show(1, msg1)
+            self.trace.show(1, ''.join(msg1))
             raise Exception(f"tctype={tctype}: we implicitly assume the tropospheric correction type (tctype) is 1. if tctype=0 (no topospheric correction), we don't know whether we read the following tropospheric correction data or not. Others are reserved.")
-        for grid in range(ngrid):
-            if len_payload < payload.pos + 9 + 8:
-                return False
-            msg1 += '\nST9 SAT  Lat.   Lon. residual[TECU]'
-            vd_h = payload.read(9).i  # hydrostatic vertical delay
-            vd_w = payload.read(8).i  # wet         vertical delay
-            if vd_h != -256 and vd_w != -128:
-                msg1 += f' hydro_delay={2.3+vd_h*0.004:6.3f}[m] wet_delay={0.252+vd_w*0.004:6.3f}[m]'
-            for satsys in self.satsys:
-                for maskpos, gsys in enumerate(self.gsys[satsys]):
-                    if not svmask[satsys][maskpos]:
-                        continue
-                    if len_payload < payload.pos + bw:
-                        return False
-                    res  = payload.read(f'i{bw}')  # residual
-                    if (srange == 1 and res != -32768) or \
-                       (srange == 0 and res != -64):
-                        lat, lon = CLASGRID[cnid-1][2][grid]
-                        msg1 += f'\nST9 {gsys} {lat:5.2f} {lon:6.2f}         {res*0.04:{FMT_TECU}}'
-        self.trace.show(1, msg1)
+        sats = [gsys for satsys, t_gsys, ngsys in self.sat_layout
+            for k, gsys in enumerate(t_gsys) if (svmask[satsys] >> (ngsys - 1 - k)) & 1]
+        fmt = [-9, -8] + [-bw] * len(sats)  # hydrostatic and wet vertical delays, residuals
+        if len_payload < payload.pos + (9 + 8 + bw * len(sats)) * ngrid:
+            return False
+        cols = [col.tolist() for col in _records(payload, fmt, ngrid)]
+        if show1:
+            grids = CLASGRID[cnid-1][2]
+            for grid in range(ngrid):
+                msg1.append('\nST9 SAT  Lat.   Lon. residual[TECU]')
+                vd_h, vd_w = cols[0][grid], cols[1][grid]
+                if vd_h != -256 and vd_w != -128:
+                    msg1.append(f' hydro_delay={2.3+vd_h*0.004:6.3f}[m] wet_delay={0.252+vd_w*0.004:6.3f}[m]')
+                for k, gsys in enumerate(sats):
+                    res = cols[2 + k][grid]
+                    if res != inv:
+                        lat, lon = grids[grid]
+                        msg1.append(_LINE_GRID_TECU('ST9', gsys, lat, lon, res*0.04))
+        self.trace.show(1, ''.join(msg1))
         self.stat_both += payload.pos
         return True
 
@@ -865,7 +1123,8 @@ class Ssr:
         if len_payload < payload.pos + size:
             return False
         aux_frame_data = payload.read(size)
-        self.trace.show(1, f'ST10 {counter}:{aux_frame_data.hex}')
+        if self.trace.t_level >= 1:
+            self.trace.show(1, f'ST10 {counter}:{aux_frame_data.hex}')
         self.stat_both += payload.pos
         return True
 
@@ -878,34 +1137,36 @@ class Ssr:
         f_o = payload.read(1).u  # orbit existing flag
         f_c = payload.read(1).u  # clock existing flag
         f_n = payload.read(1).u  # network correction
-        msg1 = f"ST11 orbit_correction={'on' if f_o else 'off'} clock_correction={'on' if f_c else 'off'} network_correction={'on' if f_n else 'off'}"
+        show1 = self.trace.t_level >= 1
+        msg1 = [f"ST11 orbit_correction={'on' if f_o else 'off'} clock_correction={'on' if f_c else 'off'} network_correction={'on' if f_n else 'off'}"]
         svmask = {}
-        for satsys in self.satsys:
-            ngsys = len(self.gsys[satsys])
-            svmask[satsys] = bitstring.Bits('0b1')*ngsys
+        for satsys, _, ngsys in self.sat_layout:
+            svmask[satsys] = (1 << ngsys) - 1  # all satellites
         if f_n:
             if len_payload < payload.pos + 5:
                 return False
             cnid = payload.read(5).u  # compact network ID
             if cnid < 1 or N_NID < cnid:
                 raise Exception(f"invalid compact network ID: {cnid}")
-            msg1 += f"\nST11 NID={cnid} ({CLASGRID[cnid-1][0]})"
-            for satsys in self.satsys:
-                ngsys = len(self.gsys[satsys])
+            msg1.append(f"\nST11 NID={cnid} ({CLASGRID[cnid-1][0]})")
+            for satsys, _, ngsys in self.sat_layout:
                 if len_payload < payload.pos + ngsys:
                     return False
-                svmask[satsys] = payload.read(ngsys)
-        msg1 += "\nST11 SAT"
+                svmask[satsys] = _read_mask(payload, ngsys)
+        msg1.append("\nST11 SAT")
         if f_o:
-            msg1 += " IODE radial[m] along[m] cross[m]"
+            msg1.append(" IODE radial[m] along[m] cross[m]")
         if f_c:
-            msg1 += "   c0[m]"
-        for satsys in self.satsys:
-            for i, gsys in enumerate(self.gsys[satsys]):
-                if not svmask[satsys][i]:
+            msg1.append("   c0[m]")
+        for satsys, t_gsys, ngsys in self.sat_layout:
+            t_svmask = svmask[satsys]
+            if not t_svmask:
+                continue
+            for i, gsys in enumerate(t_gsys):
+                if not (t_svmask >> (ngsys - 1 - i)) & 1:
                     continue
                 if f_o:
-                    bw = 10 if satsys == 'E' else 8  # IODE bit width
+                    bw = _IODE_BW.get(satsys, 8)
                     if len_payload < payload.pos + bw + 15 + 13 + 13:
                         return False
                     iode   = payload.read(bw).u  # IODE
@@ -919,17 +1180,18 @@ class Ssr:
                 f_o_ok = f_o and (radial != -16384 and along != -4096 and cross != -4096)
                 f_c_ok = f_c and c0 != -16384
                 if f_o_ok or f_c_ok:
-                    msg1 += f"\nST11 {gsys}"
+                    if show1:
+                        msg1.append(f"\nST11 {gsys}")
                 if f_o_ok:
-                    msg1 += f' {iode:{FMT_IODE}}   {radial*0.0016:{FMT_ORB}}  {along*0.0064:{FMT_ORB}}  {cross*0.0064:{FMT_ORB}}'
+                    if show1:
+                        msg1.append(f' {iode:{FMT_IODE}}   {radial*0.0016:{FMT_ORB}}  {along*0.0064:{FMT_ORB}}  {cross*0.0064:{FMT_ORB}}')
                 if f_c_ok:
-                    msg1 += f" {c0*1.6e-3:{FMT_CLK}}"
-        self.trace.show(1, msg1)
-        self.stat_both += stat_pos + 3
-        self.stat_bsat += payload.pos - stat_pos - 3
-        if f_n:  # correct bit number because because we count up bsat as NID
-            self.stat_both += 5
-            self.stat_bsat -= 5
+                    if show1:
+                        msg1.append(f" {c0*1.6e-3:{FMT_CLK}}")
+        self.trace.show(1, ''.join(msg1))
+        nhead = 3 + 5 * f_n  # flags and NID, we count up bsat as NID otherwise
+        self.stat_both += stat_pos + nhead
+        self.stat_bsat += payload.pos - stat_pos - nhead
         return True
 
     def decode_cssr_st12(self, payload):
@@ -937,110 +1199,91 @@ class Ssr:
         len_payload = len(payload)
         if len_payload < payload.pos + 2 + 2 + 5 + 6:
             return False
-        tavail = payload.read(2)    # troposhpere correction availability
-        savail = payload.read(2)    # STEC        correction availability
+        tavail = payload.read(2).u  # troposhpere correction availability
+        savail = payload.read(2).u  # STEC        correction availability
         cnid   = payload.read(5).u  # compact network ID
         ngrid  = payload.read(6).u  # number of grids
         if cnid < 1 or N_NID < cnid:
             raise Exception(f"invalid compact network ID: {cnid}")
         if CLASGRID[cnid-1][1] != ngrid:
             raise Exception(f"cnid={cnid}, ngrid={ngrid} != {CLASGRID[cnid-1][1]}")
-        msg1 = f"ST12 Trop NID={cnid} ({CLASGRID[cnid-1][0]})"
-        if tavail[0]:  # bool object
+        grids = CLASGRID[cnid-1][2]
+        show1 = self.trace.t_level >= 1
+        msg1 = [f"ST12 Trop NID={cnid} ({CLASGRID[cnid-1][0]})"]
+        if tavail & 2:
             # 0 <= ttype (forward reference)
             if len_payload < payload.pos + 6 + 2 + 9:
                 return False
-            tqi   = payload.read(6)    # tropo quality indication
+            tqi   = payload.read(6).u  # tropo quality indication
             ttype = payload.read(2).u  # tropo correction type
             t00   = payload.read(9).i  # tropo poly coeff
-            msg1 += f" qual={ura2dist(tqi)}[mm]"
+            msg1.append(f" qual={ura2dist(tqi)}[mm]")
             if t00 != -256:
-                msg1 += f" t00={t00*0.004:.3f}[m]"
+                msg1.append(f" t00={t00*0.004:.3f}[m]")
             if 1 <= ttype:
                 if len_payload < payload.pos + 7 + 7:
                     return False
                 t01  = payload.read(7).i
                 t10  = payload.read(7).i
                 if t01 != -64 and t10 != -64:
-                    msg1 += f" t01={t01*0.002:.3f}[m/deg] t10={t10*0.002:.3f}[m/deg]"
+                    msg1.append(f" t01={t01*0.002:.3f}[m/deg] t10={t10*0.002:.3f}[m/deg]")
             if 2 <= ttype:
                 if len_payload < payload.pos + 7:
                     return False
                 t11  = payload.read(7).i
                 if t11 != -64:
-                    msg1 += f" t11={t11*0.001:.3f}[m/deg^2]"
-        if tavail[1]:  # bool object
+                    msg1.append(f" t11={t11*0.001:.3f}[m/deg^2]")
+        if tavail & 1:
             if len_payload < payload.pos + 1 + 4:
                 return False
             trs  = payload.read(1).u  # tropo residual size
             tro  = payload.read(4).u  # tropo residual offset
             bw   = 8 if trs else 6
-            msg1 += f" offset={tro*0.02:.3f}[m]"
+            inv  = -128 if trs else -32  # invalid tropo residual
+            msg1.append(f" offset={tro*0.02:.3f}[m]")
             if len_payload < payload.pos + bw * ngrid:
                 return False
-            msg1 += "\nST12 Trop  Lat.   Lon. residual[m]"
-            for grid in range(ngrid):
-                tr = payload.read(bw).i  # tropo residual
-                if (bw == 6 and tr != -32) or (bw == 8 and tr != -128):
-                    lat, lon = CLASGRID[cnid-1][2][grid]
-                    msg1 += f"\nST12 Trop {lat:5.2f} {lon:6.2f}     {tr*0.004:{FMT_TROP}}"
+            msg1.append("\nST12 Trop  Lat.   Lon. residual[m]")
+            itr = _records(payload, [-bw], ngrid)[0]  # tropo residuals
+            if show1:
+                tr = itr * 0.004
+                for grid in np.flatnonzero(itr != inv):
+                    lat, lon = grids[grid]
+                    msg1.append(_LINE_GRID_TROP('ST12 Trop', lat, lon, tr[grid]))
         stat_pos = payload.pos
-        if savail[0]:  # bool object
+        if savail & 2:
             svmask = {}
-            for satsys in self.satsys:
-                ngsys = len(self.gsys[satsys])
+            for satsys, _, ngsys in self.sat_layout:
                 if len_payload < payload.pos + ngsys:
                     return False
-                svmask[satsys] = payload.read(ngsys)
-            for satsys in self.satsys:
-                for maskpos, gsys in enumerate(self.gsys[satsys]):
-                    if not svmask[satsys][maskpos]:
-                        continue
-                    if len_payload < payload.pos + 6 + 2 + 14:
-                        return False
-                    sqi = payload.read( 6)    # STEC quality indication
-                    sct = payload.read( 2).u  # STEC correct type
-                    c00 = payload.read(14).i
-                    msg1 += f"\nST12 STEC {gsys}  Lat.   Lon. residual[TECU] qual={ura2dist(sqi):.3f}[TECU]"
-                    if c00 != -8192:
-                        msg1 += f" c00={c00*0.05:.3f}[TECU]"
-                    if 1 <= sct:
-                        if len_payload < payload.pos + 12 + 12:
-                            return False
-                        c01 = payload.read(12).i
-                        c10 = payload.read(12).i
-                        if c01 != -2048 and c10 != -2048:
-                            msg1 += f" c01={c01*0.02:.3f}[TECU/deg] c10={c10*0.02:.3f}[TECU/deg]"
-                    if 2 <= sct:
-                        if len_payload < payload.pos + 10:
-                            return False
-                        c11 = payload.read(10).i
-                        if c11 != -512:
-                            msg1 += f" c11={c11* 0.02:.3f}[TECU/deg^2]"
-                    if 3 <= sct:
-                        if len_payload < payload.pos + 8 + 8:
-                            return False
-                        c02 = payload.read(8).i
-                        c20 = payload.read(8).i
-                        if c02 != -128 and c20 != -128:
-                            msg1 += f" c02={c02*0.005:.3f}[TECU/deg^2] c20={c20*0.005:.3f}[TECU/deg^2]"
-                    if len_payload < payload.pos + 2:
-                        return False
-                    srs = payload.read(2).u  # STEC residual size
-                    bw  = [   4,    4,    5,    7][srs]
-                    lsb = [0.04, 0.12, 0.16, 0.24][srs]
-                    if len_payload < payload.pos + bw * ngrid:
-                        return False
-                    for grid in range(ngrid):
-                        sr  = payload.read(bw).i  # STEC residual
-                        lat, lon = CLASGRID[cnid-1][2][grid]
-                        if (bw == 4 and sr !=  -8) or \
-                           (bw == 5 and sr != -16) or \
-                           (bw == 7 and sr != -64):
-                            msg1 += f"\nST12 STEC {gsys} {lat:5.2f} {lon:6.2f}         {sr*lsb:{FMT_TECU}}"
-        if savail[1]:  # bool object
+                svmask[satsys] = _read_mask(payload, ngsys)
+            sats = [gsys for satsys, t_gsys, ngsys in self.sat_layout
+                for k, gsys in enumerate(t_gsys) if (svmask[satsys] >> (ngsys - 1 - k)) & 1]
+            if sats:
+                pos, head, res = _read_stec(_buffer(payload), payload.pos, len_payload, len(sats), ngrid)
+                if pos < 0:
+                    return False
+                payload.pos = pos
+            for k, gsys in enumerate(sats if show1 else ()):
+                sqi, sct, *c, srs = head[k].tolist()
+                msg1.append(f"\nST12 STEC {gsys}  Lat.   Lon. residual[TECU] qual={ura2dist(sqi):.3f}[TECU]")
+                if c[0] != -8192:
+                    msg1.append(f" c00={c[0]*0.05:.3f}[TECU]")
+                if 1 <= sct and c[1] != -2048 and c[2] != -2048:
+                    msg1.append(f" c01={c[1]*0.02:.3f}[TECU/deg] c10={c[2]*0.02:.3f}[TECU/deg]")
+                if 2 <= sct and c[3] != -512:
+                    msg1.append(f" c11={c[3]* 0.02:.3f}[TECU/deg^2]")
+                if 3 <= sct and c[4] != -128 and c[5] != -128:
+                    msg1.append(f" c02={c[4]*0.005:.3f}[TECU/deg^2] c20={c[5]*0.005:.3f}[TECU/deg^2]")
+                lsb = _STEC_LSB[srs]
+                inv = _STEC_INV[srs]  # invalid STEC residual
+                for grid, sr in enumerate(res[k].tolist()):
+                    if sr != inv:
+                        lat, lon = grids[grid]
+                        msg1.append(_LINE_GRID_TECU('ST12 STEC', gsys, lat, lon, sr*lsb))
+        if savail & 1:
             pass  # the use of this bit is not defined in ref.[1]
-        self.trace.show(1, msg1)
+        self.trace.show(1, ''.join(msg1))
         self.stat_both += stat_pos
         self.stat_bsat += payload.pos - stat_pos
         return True
@@ -1050,8 +1293,8 @@ class Ssr:
         self.msgnum  = 0
         self.subtype = 0
         len_payload  = len(payload)
-        if payload.all(0):  # payload is zero padded
-            self.trace.show(2, f"null {len(payload.bin)} bits", dec='dark')
+        if not payload.any(1):  # payload is zero padded
+            self.trace.show(2, f"null {len_payload} bits", dec='dark')
             return False
         if len_payload < payload.pos + 12 + 4:
             return False
@@ -1090,14 +1333,15 @@ class Ssr:
                 self.trace.show(0, f"IOD SSR mismatch: {iodssr} != {iodssr}", fg='red')
                 return False
             return True
-        self.trace.show(0, f"MDCCPPP-Iono msgnum should be 1 or 2 ({self.msgnum}), ST{self.subtype}, size {len(payload.bin)} bits\nMDCPPP dump: {payload.bin}", fg='red')
+        self.trace.show(0, f"MDCCPPP-Iono msgnum should be 1 or 2 ({self.msgnum}), ST{self.subtype}, size {len_payload} bits\nMDCPPP dump: {payload.bin}", fg='red')
         return False
 
     def decode_mdcppp_mt1(self, payload):  # ref. [3]
         ''' decodes MADOCA-PPP MT1 messages and returns True if success '''
         len_payload = len(payload)
-        msg1 = f'MT1 Epoch={epoch2timedate(self.epoch)} UI={CSSR_UI[self.ui]:2d}s({self.ui}) MMI={self.mmi} IODSSR={self.iodssr} Region={self.region_id}{"*" if self.region_alert else" "} {self.len_msg}bit {"cont." if self.mmi else ""} NumAreas={self.n_areas}'
-        msg1 += '\n # shape lat[deg] lon[deg] lats lons / radius[km]'
+        show1 = self.trace.t_level >= 1
+        msg1 = [f'MT1 Epoch={epoch2timedate(self.epoch)} UI={CSSR_UI[self.ui]:2d}s({self.ui}) MMI={self.mmi} IODSSR={self.iodssr} Region={self.region_id}{"*" if self.region_alert else" "} {self.len_msg}bit {"cont." if self.mmi else ""} NumAreas={self.n_areas}']
+        msg1.append('\n # shape lat[deg] lon[deg] lats lons / radius[km]')
         for _ in range(self.n_areas):
             if len_payload < payload.pos + 5 + 1:
                 return False
@@ -1110,15 +1354,17 @@ class Ssr:
                 lon_ref  = payload.read(12).u  # center longitude of rectangle area
                 lat_span = payload.read( 8).u  # span   latitude  of rectangle area
                 lon_span = payload.read( 8).u  # span   longitude of rectangle area
-                msg1 += f'\n{area_no:2d} RECT    {lat_ref*0.1:6.1f}  {lon_ref*0.1:7.1f} {lat_span*0.1:4.1f} {lon_span*0.1:4.1f}'
+                if show1:
+                    msg1.append(f'\n{area_no:2d} RECT    {lat_ref*0.1:6.1f}  {lon_ref*0.1:7.1f} {lat_span*0.1:4.1f} {lon_span*0.1:4.1f}')
             else:  # shape == 1
                 if len_payload < payload.pos + 15 + 16 + 8:
                     return False
                 lat_ref  = payload.read(15).i  # center latitude  of circle area
                 lon_ref  = payload.read(16).u  # center longitude of circle area
                 radius   = payload.read( 8).u  # radius           of circle area
-                msg1 += f'\n{area_no:2d} CIRCLE  {lat_ref*0.01:6.1f}  {lon_ref*0.01:7.1f} {radius*10:4d}'
-        self.trace.show(1, msg1)
+                if show1:
+                    msg1.append(f'\n{area_no:2d} CIRCLE  {lat_ref*0.01:6.1f}  {lon_ref*0.01:7.1f} {radius*10:4d}')
+        self.trace.show(1, ''.join(msg1))
         return True
 
     def decode_mdcppp_mt2(self, payload):  # ref. [3]
@@ -1132,14 +1378,15 @@ class Ssr:
             ][self.stec_type]
         if len_payload < payload.pos + bw * (self.n_gps + self.n_glo + self.n_gal + self.n_bds + self.n_qzs):
             return False
-        msg1 = f'MT2 Epoch={epoch2time(self.epoch)} IODSSR={self.iodssr} Region={self.region_id} Area={self.area} G={self.n_gps} R={self.n_glo} E={self.n_gal} C={self.n_bds} J={self.n_qzs}'
-        msg1 += '\nSAT  qual[mm] c00[TECU]'
+        show1 = self.trace.t_level >= 1
+        msg1 = [f'MT2 Epoch={epoch2time(self.epoch)} IODSSR={self.iodssr} Region={self.region_id} Area={self.area} G={self.n_gps} R={self.n_glo} E={self.n_gal} C={self.n_bds} J={self.n_qzs}']
+        msg1.append('\nSAT  qual[mm] c00[TECU]')
         if 1 <= self.stec_type:
-            msg1 += " c01[TECU/deg] c10[TECU/deg]"
+            msg1.append(" c01[TECU/deg] c10[TECU/deg]")
         if 2 <= self.stec_type:
-            msg1 += " c11[TECU/deg^2]"
+            msg1.append(" c11[TECU/deg^2]")
         if 3 <= self.stec_type:
-            msg1 += " c02[TECU/deg^2] c20[TECU/deg^2]"
+            msg1.append(" c02[TECU/deg^2] c20[TECU/deg^2]")
         for satsys in ["G", "R", "E", "C", "J"]:
             numsat = 0
             if   satsys == "G": numsat = self.n_gps
@@ -1149,25 +1396,52 @@ class Ssr:
             elif satsys == "J": numsat = self.n_qzs
             for _ in range(numsat):
                 satid = payload.read( 6).u    # GNSS satellite ID
-                qi    = payload.read( 6)    # quality indicator
+                qi    = payload.read( 6).u  # quality indicator
                 c00   = payload.read(14).i    # STEC correction coefficient C00
                 if c00 != -8192:
-                    msg1 += f'\n{satsys}{satid:02d}   {ura2dist(qi):7.2f}    {c00*0.05:{FMT_TECU}}'
+                    if show1:
+                        msg1.append(f'\n{satsys}{satid:02d}   {ura2dist(qi):7.2f}    {c00*0.05:{FMT_TECU}}')
                 if 1 <= self.stec_type:
                     c01 = payload.read(12).i  # STEC correction coefficient C01
                     c10 = payload.read(12).i  # STEC correction coefficient C10
                     if c01 != -2048 and c10 != -2048:
-                        msg1 += f'        {c01*0.02:{FMT_TECU}}        {c10*0.02:{FMT_TECU}}'
+                        if show1:
+                            msg1.append(f'        {c01*0.02:{FMT_TECU}}        {c10*0.02:{FMT_TECU}}')
                 if 2 <= self.stec_type:
                     c11 = payload.read(10).i  # STEC correction coefficient C11
                     if c11 != -512:
-                        msg1 += f'          {c11*0.02:{FMT_TECU}}'
+                        if show1:
+                            msg1.append(f'          {c11*0.02:{FMT_TECU}}')
                 if 3 <= self.stec_type:
                     c02 = payload.read(8).i  # STEC correction coefficient C02
                     c20 = payload.read(8).i  # STEC correction coefficient C20
                     if c02 != -128 and c20 != -128:
-                        msg1 += f'          {c02*0.005:{FMT_TECU}}          {c20*0.005:{FMT_TECU}}'
-        self.trace.show(1, msg1)
+                        if show1:
+                            msg1.append(f'          {c02*0.005:{FMT_TECU}}          {c20*0.005:{FMT_TECU}}')
+        self.trace.show(1, ''.join(msg1))
         return True
 
+    _ST_DISPATCH = {  # decoder for CSSR subtype
+         1: decode_cssr_st1,
+         2: decode_cssr_st2,
+         3: decode_cssr_st3,
+         4: decode_cssr_st4,
+         5: decode_cssr_st5,
+         6: decode_cssr_st6,
+         7: decode_cssr_st7,
+         8: decode_cssr_st8,
+         9: decode_cssr_st9,
+        10: decode_cssr_st10,
+        11: decode_cssr_st11,
+        12: decode_cssr_st12,
+    }
+
+    _SSR_DISPATCH = {  # decoder for RTCM SSR message type
+        'SSR orbit'    : ssr_decode_orbit,
+        'SSR clock'    : ssr_decode_clock,
+        'SSR code bias': ssr_decode_code_bias,
+        'SSR URA'      : ssr_decode_ura,
+        'SSR hr clock' : ssr_decode_hr_clock,
+    }
+
 # EOF
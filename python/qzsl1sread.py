@@ -113,11 +113,8 @@ class QzsL1s:
         for i in range(36):        # for BeiDou
             if df.read(1).u: self.mask_prn.append(f'C{i+1:02d}')
         df.pos += 29               # spare
-        msg = f": selected sats:"
-        for sat in self.mask_prn:
-            msg += " " + sat
-        msg += f" ({len(self.mask_prn)} sats, IODP={self.iodp})"
-        return msg
+        sats = ''.join(" " + sat for sat in self.mask_prn)
+        return f": selected sats:{sats} ({len(self.mask_prn)} sats, IODP={self.iodp})"
 
     def decode_satellite_health(self, df):  # ref.[3], sect.4.1.2.10, MT51
         ''' returns decoded message '''
@@ -134,11 +131,8 @@ class QzsL1s:
         for i in range(36):  # for BeiDou
             if not df.read(1).u: self.mask_uh.append(f'C{i:02d}')
         df.pos += 29         # spare
-        msg = ": lockout sats:"
-        for sat in self.mask_uh:
-            msg += " " + sat
-        msg += f" ({len(self.mask_uh)} sats)"
-        return msg
+        sats = ''.join(" " + sat for sat in self.mask_uh)
+        return f": lockout sats:{sats} ({len(self.mask_uh)} sats)"
 
     def decode_data_issue_number(self, df):  # ref.[3], sect.4.1.2.8, MT49
         ''' returns decoded message '''
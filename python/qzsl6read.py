@@ -234,36 +234,11 @@ class QzsL6:
             self.trace.show(0, f"Unknown message number: {self.ssr.msgnum}", fg='red')
             return False
         # CLAS (ref.[1]) and MADOCA-PPP orbit & clock augmentation (ref.[3])
-        if   self.ssr.subtype == 1:
-            decoded = self.ssr.decode_cssr_st1(self.payload)
-        elif self.ssr.subtype == 2:
-            decoded = self.ssr.decode_cssr_st2(self.payload)
-        elif self.ssr.subtype == 3:
-            decoded = self.ssr.decode_cssr_st3(self.payload)
-        elif self.ssr.subtype == 4:
-            decoded = self.ssr.decode_cssr_st4(self.payload)
-        elif self.ssr.subtype == 5:
-            decoded = self.ssr.decode_cssr_st5(self.payload)
-        elif self.ssr.subtype == 6:
-            decoded = self.ssr.decode_cssr_st6(self.payload)
-        elif self.ssr.subtype == 7:
-            decoded = self.ssr.decode_cssr_st7(self.payload)
-        elif self.ssr.subtype == 8:
-            decoded = self.ssr.decode_cssr_st8(self.payload)
-        elif self.ssr.subtype == 9:
-            decoded = self.ssr.decode_cssr_st9(self.payload)
-        elif self.ssr.subtype == 10:
-            decoded = self.ssr.decode_cssr_st10(self.payload)
-        elif self.ssr.subtype == 11:
-            decoded = self.ssr.decode_cssr_st11(self.payload)
-        elif self.ssr.subtype == 12:
-            decoded = self.ssr.decode_cssr_st12(self.payload)
-        else:
-            raise Exception(f"Unknown CSSR subtype: {self.ssr.subtype}")
+        decoded = self.ssr.decode_cssr_st(self.payload)
         if decoded:
             if self.fp_rtcm:
                 send_rtcm(self.fp_rtcm, self.payload[:self.payload.pos])  # RTCM MT 4073
-            self.payload = self.payload[self.payload.pos:]  # discard decoded part
+            del self.payload[:self.payload.pos]  # discard decoded part in place
             self.payload.pos = 0
         return decoded
 
@@ -335,7 +310,7 @@ class QzsL6:
             self.trace.show(1, f"Unknown message number: {self.ssr.msgnum}", fg='red')
             decoded = False
         if decoded:
-            self.payload = self.payload[self.payload.pos:]  # discard decoded part
+            del self.payload[:self.payload.pos]  # discard decoded part in place
             self.payload.pos = 0
         return decoded
 
@@ -352,6 +327,9 @@ if __name__ == '__main__':
     parser.add_argument(
         '-c', '--color', action='store_true',
         help='apply ANSI color escape sequences even for non-terminal.')
+    parser.add_argument(
+        '-j', '--jit', action='store_true',
+        help='decode SSR messages with numba JIT compiled kernels, faster on long input.')
     parser.add_argument(
         '-m', '--message', action='store_true',
         help='show display messages to stderr')
@@ -373,6 +351,7 @@ if __name__ == '__main__':
         fp_disp, fp_rtcm = None, sys.stdout
     if args.message:  # show QZS message to stderr
         fp_disp = sys.stderr
+    libssr.JIT |= args.jit
     trace = libtrace.Trace(fp_disp, args.trace, args.color)
     qzsl6 = QzsL6(trace, args.statistics)
     qzsl6.fp_rtcm = fp_rtcm
@@ -103,7 +103,7 @@ class Rtcm:
         return True
 
     def decode(self):
-        msgnum = self.payload.read('u12')  # message number
+        msgnum = self.payload.read(12).u  # message number
         satsys = msgnum2satsys(msgnum)
         mtype  = msgnum2mtype(msgnum)
         msg = self.trace.msg(0, f'RTCM {msgnum} ', fg='green') + self.trace.msg(0, f'{satsys:1} {mtype:14}', fg='yellow')
@@ -124,28 +124,20 @@ class Rtcm:
             self.payload.pos = 0  # reset bit position
             msg += self.ssr.decode_cssr(self.payload)  # needs message type info
         elif mtype == 'Raw CSSR':
-            self.payload.pos = len(self.payload.bin)  # cannot decode raw CSSR, skip it
+            self.payload.pos = len(self.payload)  # cannot decode raw CSSR, skip it
         elif 'SSR' in mtype:
             self.ssr.ssr_decode_head(self.payload, satsys, mtype)
-            if mtype == 'SSR orbit':
-                msg += self.ssr.ssr_decode_orbit(self.payload, satsys)
-            elif mtype == 'SSR clock':
-                msg += self.ssr.ssr_decode_clock(self.payload, satsys)
-            elif mtype == 'SSR code bias':
-                msg += self.ssr.ssr_decode_code_bias(self.payload, satsys)
-            elif mtype == 'SSR URA':
-                msg += self.ssr.ssr_decode_ura(self.payload, satsys)
-            elif mtype == 'SSR hr clock':
-                msg += self.ssr.ssr_decode_hr_clock(self.payload, satsys)
-            else:
-                msg += f'unknown SSR message: {msgnum} {mtype}'
+            ssr_msg = self.ssr.ssr_decode(self.payload, satsys, mtype)
+            if ssr_msg is None:
+                ssr_msg = f'unknown SSR message: {msgnum} {mtype}'
+            msg += ssr_msg
         else:
             msg += f'unknown message: {mtype}'
-            self.payload.pos = len(self.payload.bin)  # skip unknown message
+            self.payload.pos = len(self.payload)  # skip unknown message
         if self.payload.pos % 8 != 0:  # byte align
             self.payload.pos += 8 - (self.payload.pos % 8)
-        if self.payload.pos != len(self.payload.bin):
-            msg += self.trace.msg(0, f' packet size mismatch: expected {len(self.payload.bin)}, actual {self.payload.pos}', fg='red')
+        if self.payload.pos != len(self.payload):
+            msg += self.trace.msg(0, f' packet size mismatch: expected {len(self.payload)}, actual {self.payload.pos}', fg='red')
         self.trace.show(0, msg)
 
     def decode_antenna_position(self, payload, msgnum):
@@ -229,7 +221,7 @@ class Rtcm:
         nsat  = payload.read( 5).u  # number of signals, DF006 (GPS)
         smind = payload.read( 1).u  # divrgence-free smoothing ind, DF007
         smint = payload.read( 3).u  # smoothing interval, DF008
-        msg = ''
+        msg = []
         for _ in range(nsat):
             satid     = payload.read( 6).u  # satellite id, DF009, DF038
             cind1     = payload.read( 1).u  # L1 code indicator, DF010, DF039
@@ -249,10 +241,10 @@ class Rtcm:
                 if mtype in 'Full':
                     cnr2  = payload.read( 8).u  # L2 CNR, DF020, DF050
             if satsys != 'S':
-                msg += f'{satsys}{satid:02} '
+                msg.append(f'{satsys}{satid:02} ')
             else:
-                msg += f'{satsys}{satid+119:3} '
-        return msg
+                msg.append(f'{satsys}{satid+119:3} ')
+        return ''.join(msg)
 
     def decode_msm(self, payload, satsys, mtype):
         ''' decodes MSM message and returns message '''
@@ -321,14 +313,10 @@ class Rtcm:
                 cnr  = payload.read( bcnr).u  # CNR, DF403, 408
             if '5' in mtype or '7' in mtype:
                 fphr = payload.read(15).i  # fine phaserange rate, DF404
-        msg = ''
         if satsys != 'S':
-            for satid in range(nsat):
-                msg += f'{satsys}{sat_mask[satid]+1:02} '
+            return ''.join(f'{satsys}{sat_mask[satid]+1:02} ' for satid in range(nsat))
         else:
-            for satid in range(nsat):
-                msg += f'{satsys}{sat_mask[satid]+119:3} '
-        return msg
+            return ''.join(f'{satsys}{sat_mask[satid]+119:3} ' for satid in range(nsat))
 
 def send_rtcm(fp, rtcm_payload):
     if not fp:
@@ -443,6 +431,9 @@ if __name__ == '__main__':
     parser.add_argument(
         '-c', '--color', action='store_true',
         help='apply ANSI color escape sequences even for non-terminal.')
+    parser.add_argument(
+        '-j', '--jit', action='store_true',
+        help='decode SSR messages with numba JIT compiled kernels, faster on long input.')
     parser.add_argument(
         '-t', '--trace', type=int, default=0,
         help='show display verbosely: 1=subtype detail, 2=subtype and bit image.')
@@ -451,6 +442,7 @@ if __name__ == '__main__':
     if args.trace < 0:
         libtrace.err(f'trace level should be positive ({args.trace}).')
         sys.exit(1)
+    libssr.JIT |= args.jit
     trace = libtrace.Trace(fp_disp, args.trace, args.color)
     rtcm = Rtcm(trace)
     try:
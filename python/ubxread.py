@@ -40,6 +40,20 @@ LEN_L1OF =  85  # message length of GLO L1OF, L2OF
 LEN_L1S  = 250  # message length of QZS L1S & SBAS L1C/A
 LEN_B1I  = 300  # message length of BDS B1I, B2I
 
+# [1] 1.5.2 GNSS identifiers
+GNSSNAME = ('G', 'S', 'E', 'B', 'IMES', 'J', 'R', 'I')
+# [1] 1.5.4 Signal identifiers
+SIGNAME = (  # signal name table: (gnssid, signae) -> signal name
+    ('L1CA', '', '', 'L2CL', 'L2CM', '', 'L5I', 'L5Q'),             # GPS
+    ('L1CA',),                                                      # SBAS
+    ('E1C', 'E1B', '', 'E5aI', 'E5aQ', 'E5bI', 'E5bQ'),             # GAL
+    ('B1I', 'B1I', 'B2I', 'B2I', '', 'B1C', '', 'B2a'),             # BDS
+    (),                                                             # undef
+    ('L1CA', 'L1S', '', '', 'L2CM', 'L2CL', '', '', 'L5I', 'L5Q'),  # QZS
+    ('L1OF', '', 'L2OF'),                                           # GLO
+    ('L5',),                                                        # IRN
+)
+
 class UbxReceiver:
     payload_prev = bitstring.BitStream()  # previous payload
 
@@ -83,19 +97,8 @@ class UbxReceiver:
                 libtrace.err(f'checksum error: {csum.hex()}!={csum1:02x}{csum2:02x}')
                 continue
             break
-        # [1] 1.5.2 GNSS identifiers
-        gnssname = ['G', 'S', 'E', 'B', 'IMES', 'J', 'R', 'I'][gnssid]
-        # [1] 1.5.4 Signal identifiers
-        signame = [ # signal name table: (gnssid, signae) -> signal name
-        ['L1CA', '', '', 'L2CL', 'L2CM', '', 'L5I', 'L5Q'],             # GPS
-        ['L1CA'],                                                       # SBAS
-        ['E1C', 'E1B', '', 'E5aI', 'E5aQ', 'E5bI', 'E5bQ'],             # GAL
-        ['B1I', 'B1I', 'B2I', 'B2I', '', 'B1C', '', 'B2a'],             # BDS
-        [],                                                             # undef
-        ['L1CA', 'L1S', '', '', 'L2CM', 'L2CL', '', '', 'L5I', 'L5Q'],  # QZS
-        ['L1OF', '', 'L2OF'],                                           # GLO
-        ['L5'],                                                         # IRN
-        ][gnssid][sigid]
+        gnssname = GNSSNAME[gnssid]
+        signame  = SIGNAME[gnssid][sigid]
         payload_perm = bytearray(n_word * 4)
         u4perm(payload, payload_perm)
         self.svid     = svid
@@ -215,6 +215,9 @@ rtcm() {
     BASENAME=20221213-010900
     do_test $CODE $EXT_FROM $EXT_TO $BASENAME $SRCDIR $ARG
 
+    BASENAME=20241015-ssrclock
+    do_test $CODE $EXT_FROM $EXT_TO $BASENAME $SRCDIR $ARG
+
     SRCDIR=expect/
     BASENAME=20220326-231200clas.4073
     do_test $CODE $EXT_FROM $EXT_TO $BASENAME $SRCDIR $ARG
@@ -265,6 +268,22 @@ bds_b2() {
     echo ""
 }
 
+lib_check() {
+    echo "Library self check:"
+    for CODE in ${CODEDIR}libeph.py; do
+        echo -n "  ${CODE}: "
+        ${CODE} > /dev/null
+        if [[ $? -eq 0 ]]; then
+            printf "${ESC}[32mPassed.${ESC}[m\n"
+        else
+            printf  "${ESC}[31mFailed.${ESC}[m\n"
+            ${CODE}
+            exit 1
+        fi
+    done
+    echo ""
+}
+
 psdr_conv
 alst_conv
 nov_conv
@@ -279,6 +298,7 @@ rtcm
 gal_inav
 gal_e6
 bds_b2
+lib_check
 
 # EOF
 